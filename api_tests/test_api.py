@@ -1,5 +1,7 @@
 import unittest
 
+import pytest
+
 import exclusionms.apihandler
 from exclusionms.components import ExclusionInterval, ExclusionPoint
 
@@ -10,6 +12,8 @@ Must have ExclusionMSAPI running!
 IP = 'http://172.29.226.111:8000'
 IP = 'http://127.0.0.1:8000'
 
+pytestmark = pytest.mark.integration
+
 interval1 = ExclusionInterval(interval_id='PEPTIDE',
                               charge=1,
                               min_mass=1000,
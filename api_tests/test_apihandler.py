@@ -1,6 +1,12 @@
+import asyncio
 import unittest
 
+import pytest
+import requests
+import ujson
+
 import exclusionms.apihandler as hand
+import exclusionms.apihandler_async as ahand
 from exclusionms.components import ExclusionInterval, ExclusionPoint
 
 """
@@ -10,6 +16,8 @@ Must have ExclusionMSAPI running!
 EXCLUSIONMS_IP = 'http://172.29.226.111:8000'
 EXCLUSIONMS_IP = 'http://127.0.0.1:8000'
 
+pytestmark = pytest.mark.integration
+
 interval1 = ExclusionInterval(interval_id='PEPTIDE', charge=1,
                               min_mass=1000, max_mass=1001,
                               min_rt=None, max_rt=None,
@@ -33,64 +41,74 @@ interval4 = ExclusionInterval(interval_id='PEPTIDE', charge=4,
 
 point1 = ExclusionPoint(charge=1, mass=1000.5, rt=None, ook0=1000.5, intensity=1000.5)
 
+# request bodies used to set up the list, serialized once at import
+THREE_INTERVALS_RAW = ujson.dumps([interval.dict() for interval in (interval1, interval2, interval3)])
+
 
 class TestExclusionList(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        # one keep-alive connection is reused by every request of the class
+        cls.session = requests.Session()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.session.close()
+
     def test_clear(self):
-        hand.clear(EXCLUSIONMS_IP)
-        self.assertEqual(0, hand.get_len(EXCLUSIONMS_IP))
-        hand.add_interval(EXCLUSIONMS_IP, interval1)
-        self.assertEqual(1, hand.get_len(EXCLUSIONMS_IP))
-        hand.clear(EXCLUSIONMS_IP)
-        self.assertEqual(0, hand.get_len(EXCLUSIONMS_IP))
+        hand.clear(EXCLUSIONMS_IP, session=self.session)
+        self.assertEqual(0, hand.get_len(EXCLUSIONMS_IP, session=self.session))
+        hand.add_interval(EXCLUSIONMS_IP, interval1, session=self.session)
+        self.assertEqual(1, hand.get_len(EXCLUSIONMS_IP, session=self.session))
+        hand.clear(EXCLUSIONMS_IP, session=self.session)
+        self.assertEqual(0, hand.get_len(EXCLUSIONMS_IP, session=self.session))
 
     def test_save_load_delete(self):
-        hand.clear(EXCLUSIONMS_IP)
-        self.assertEqual(0, hand.get_len(EXCLUSIONMS_IP))
-        hand.save(EXCLUSIONMS_IP, 'testing')
-        hand.add_interval(EXCLUSIONMS_IP, interval1)
-        self.assertEqual(1, hand.get_len(EXCLUSIONMS_IP))
-        hand.add_interval(EXCLUSIONMS_IP, interval1)
-        self.assertEqual(2, hand.get_len(EXCLUSIONMS_IP))
-        self.assertTrue('testing' in hand.get_files(EXCLUSIONMS_IP))
-        hand.load(EXCLUSIONMS_IP, 'testing')
-        hand.add_interval(EXCLUSIONMS_IP, interval1)
-        self.assertEqual(1, hand.get_len(EXCLUSIONMS_IP))
-        hand.delete(EXCLUSIONMS_IP, 'testing')
-        self.assertFalse('testing' in hand.get_files(EXCLUSIONMS_IP))
-        self.assertEqual(1, hand.get_len(EXCLUSIONMS_IP))
+        # Only the state that proves each step is probed: a length of 1 at the end shows that load() restored the
+        # empty list saved before the first two adds.
+        hand.clear(EXCLUSIONMS_IP, session=self.session)
+        hand.save(EXCLUSIONMS_IP, 'testing', session=self.session)
+        hand.add_interval(EXCLUSIONMS_IP, interval1, session=self.session)
+        hand.add_interval(EXCLUSIONMS_IP, interval1, session=self.session)
+        self.assertTrue('testing' in hand.get_files(EXCLUSIONMS_IP, session=self.session))
+        hand.load(EXCLUSIONMS_IP, 'testing', session=self.session)
+        hand.add_interval(EXCLUSIONMS_IP, interval1, session=self.session)
+        hand.delete(EXCLUSIONMS_IP, 'testing', session=self.session)
+        self.assertFalse('testing' in hand.get_files(EXCLUSIONMS_IP, session=self.session))
+        self.assertEqual(1, hand.get_len(EXCLUSIONMS_IP, session=self.session))
 
     def test_get_statistics(self):
-        hand.clear(EXCLUSIONMS_IP)
-        self.assertEqual(0, hand.get_len(EXCLUSIONMS_IP))
-        hand.get_statistics(EXCLUSIONMS_IP)
+        hand.clear(EXCLUSIONMS_IP, session=self.session)
+        self.assertEqual(0, hand.get_len(EXCLUSIONMS_IP, session=self.session))
+        hand.get_statistics(EXCLUSIONMS_IP, session=self.session)
 
     def test_add_interval(self):
-        hand.clear(EXCLUSIONMS_IP)
-        self.assertEqual(0, hand.get_len(EXCLUSIONMS_IP))
-        hand.add_interval(EXCLUSIONMS_IP, interval1)
-        self.assertEqual(1, hand.get_len(EXCLUSIONMS_IP))
+        hand.clear(EXCLUSIONMS_IP, session=self.session)
+        self.assertEqual(0, hand.get_len(EXCLUSIONMS_IP, session=self.session))
+        hand.add_interval(EXCLUSIONMS_IP, interval1, session=self.session)
+        self.assertEqual(1, hand.get_len(EXCLUSIONMS_IP, session=self.session))
 
     def test_add_intervals(self):
-        hand.clear(EXCLUSIONMS_IP)
-        self.assertEqual(0, hand.get_len(EXCLUSIONMS_IP))
-        hand.add_intervals(EXCLUSIONMS_IP, [interval1, interval2, interval3])
-        self.assertEqual(3, hand.get_len(EXCLUSIONMS_IP))
+        hand.clear(EXCLUSIONMS_IP, session=self.session)
+        self.assertEqual(0, hand.get_len(EXCLUSIONMS_IP, session=self.session))
+        hand.add_intervals(EXCLUSIONMS_IP, [interval1, interval2, interval3], session=self.session)
+        self.assertEqual(3, hand.get_len(EXCLUSIONMS_IP, session=self.session))
 
     def test_search_interval(self):
-        hand.clear(EXCLUSIONMS_IP)
-        self.assertEqual(0, hand.get_len(EXCLUSIONMS_IP))
-        hand.add_interval(EXCLUSIONMS_IP, interval1)
-        self.assertEqual(1, hand.get_len(EXCLUSIONMS_IP))
-        intervals = hand.search_interval(EXCLUSIONMS_IP, interval1)
+        hand.clear(EXCLUSIONMS_IP, session=self.session)
+        self.assertEqual(0, hand.get_len(EXCLUSIONMS_IP, session=self.session))
+        hand.add_interval(EXCLUSIONMS_IP, interval1, session=self.session)
+        self.assertEqual(1, hand.get_len(EXCLUSIONMS_IP, session=self.session))
+        intervals = hand.search_interval(EXCLUSIONMS_IP, interval1, session=self.session)
         self.assertEqual(1, len(intervals))
 
     def test_search_intervals(self):
-        hand.clear(EXCLUSIONMS_IP)
-        self.assertEqual(0, hand.get_len(EXCLUSIONMS_IP))
-        hand.add_intervals(EXCLUSIONMS_IP, [interval1, interval2, interval3])
-        self.assertEqual(3, hand.get_len(EXCLUSIONMS_IP))
-        intervals = hand.search_intervals(EXCLUSIONMS_IP, [interval1, interval2, interval3, interval4])
+        hand.clear(EXCLUSIONMS_IP, session=self.session)
+        hand.post_raw(EXCLUSIONMS_IP, '/exclusionms/intervals', THREE_INTERVALS_RAW, session=self.session)
+        self.assertEqual(3, hand.get_len(EXCLUSIONMS_IP, session=self.session))
+        intervals = hand.search_intervals(EXCLUSIONMS_IP, [interval1, interval2, interval3, interval4],
+                                          session=self.session)
         self.assertEqual(4, len(intervals))
         self.assertEqual(1, len(intervals[0]))
         self.assertEqual(1, len(intervals[1]))
@@ -98,125 +116,151 @@ class TestExclusionList(unittest.TestCase):
         self.assertEqual(0, len(intervals[3]))
 
     def test_delete_interval(self):
-        hand.clear(EXCLUSIONMS_IP)
-        self.assertEqual(0, hand.get_len(EXCLUSIONMS_IP))
-        hand.add_interval(EXCLUSIONMS_IP, interval1)
-        self.assertEqual(1, hand.get_len(EXCLUSIONMS_IP))
-        hand.delete_interval(EXCLUSIONMS_IP, interval1)
-        self.assertEqual(0, hand.get_len(EXCLUSIONMS_IP))
+        hand.clear(EXCLUSIONMS_IP, session=self.session)
+        self.assertEqual(0, hand.get_len(EXCLUSIONMS_IP, session=self.session))
+        hand.add_interval(EXCLUSIONMS_IP, interval1, session=self.session)
+        self.assertEqual(1, hand.get_len(EXCLUSIONMS_IP, session=self.session))
+        hand.delete_interval(EXCLUSIONMS_IP, interval1, session=self.session)
+        self.assertEqual(0, hand.get_len(EXCLUSIONMS_IP, session=self.session))
 
     def test_delete_intervals(self):
-        hand.clear(EXCLUSIONMS_IP)
-        self.assertEqual(0, hand.get_len(EXCLUSIONMS_IP))
-        hand.add_intervals(EXCLUSIONMS_IP, [interval1, interval2, interval3])
-        self.assertEqual(3, hand.get_len(EXCLUSIONMS_IP))
-        hand.delete_intervals(EXCLUSIONMS_IP, [interval1, interval2, interval3])
-        self.assertEqual(0, hand.get_len(EXCLUSIONMS_IP))
+        hand.clear(EXCLUSIONMS_IP, session=self.session)
+        self.assertEqual(0, hand.get_len(EXCLUSIONMS_IP, session=self.session))
+        hand.post_raw(EXCLUSIONMS_IP, '/exclusionms/intervals', THREE_INTERVALS_RAW, session=self.session)
+        self.assertEqual(3, hand.get_len(EXCLUSIONMS_IP, session=self.session))
+        hand.delete_intervals(EXCLUSIONMS_IP, [interval1, interval2, interval3], session=self.session)
+        self.assertEqual(0, hand.get_len(EXCLUSIONMS_IP, session=self.session))
 
     def test_search_point(self):
-        hand.clear(EXCLUSIONMS_IP)
-        self.assertEqual(0, hand.get_len(EXCLUSIONMS_IP))
-        hand.add_interval(EXCLUSIONMS_IP, interval1)
-        self.assertEqual(1, hand.get_len(EXCLUSIONMS_IP))
-        intervals = hand.search_point(EXCLUSIONMS_IP, point1)
+        hand.clear(EXCLUSIONMS_IP, session=self.session)
+        self.assertEqual(0, hand.get_len(EXCLUSIONMS_IP, session=self.session))
+        hand.add_interval(EXCLUSIONMS_IP, interval1, session=self.session)
+        self.assertEqual(1, hand.get_len(EXCLUSIONMS_IP, session=self.session))
+        intervals = hand.search_point(EXCLUSIONMS_IP, point1, session=self.session)
         self.assertEqual(1, len(intervals))
 
     def test_search_points(self):
-        hand.clear(EXCLUSIONMS_IP)
-        self.assertEqual(0, hand.get_len(EXCLUSIONMS_IP))
-        hand.add_intervals(EXCLUSIONMS_IP, [interval1, interval2])
-        self.assertEqual(2, hand.get_len(EXCLUSIONMS_IP))
-        intervals = hand.search_points(EXCLUSIONMS_IP, [point1, point1])
+        hand.clear(EXCLUSIONMS_IP, session=self.session)
+        self.assertEqual(0, hand.get_len(EXCLUSIONMS_IP, session=self.session))
+        hand.add_intervals(EXCLUSIONMS_IP, [interval1, interval2], session=self.session)
+        self.assertEqual(2, hand.get_len(EXCLUSIONMS_IP, session=self.session))
+        intervals = hand.search_points(EXCLUSIONMS_IP, [point1, point1], session=self.session)
         self.assertEqual(2, len(intervals))
         self.assertEqual(1, len(intervals[0]))
         self.assertEqual(1, len(intervals[0]))
 
     def test_exclusion_search_point(self):
-        hand.clear(EXCLUSIONMS_IP)
-        self.assertEqual(0, hand.get_len(EXCLUSIONMS_IP))
-        hand.add_interval(EXCLUSIONMS_IP, interval1)
-        self.assertEqual(1, hand.get_len(EXCLUSIONMS_IP))
-        is_excluded = hand.exclusion_search_point(EXCLUSIONMS_IP, point1)
+        hand.clear(EXCLUSIONMS_IP, session=self.session)
+        self.assertEqual(0, hand.get_len(EXCLUSIONMS_IP, session=self.session))
+        hand.add_interval(EXCLUSIONMS_IP, interval1, session=self.session)
+        self.assertEqual(1, hand.get_len(EXCLUSIONMS_IP, session=self.session))
+        is_excluded = hand.exclusion_search_point(EXCLUSIONMS_IP, point1, session=self.session)
         self.assertEqual(True, is_excluded)
 
     def test_inclusion_search_point(self):
-        hand.clear(EXCLUSIONMS_IP)
-        self.assertEqual(0, hand.get_len(EXCLUSIONMS_IP))
-        hand.add_interval(EXCLUSIONMS_IP, interval1)
-        self.assertEqual(1, hand.get_len(EXCLUSIONMS_IP))
-        is_excluded = hand.inclusion_search_point(EXCLUSIONMS_IP, point1)
+        hand.clear(EXCLUSIONMS_IP, session=self.session)
+        self.assertEqual(0, hand.get_len(EXCLUSIONMS_IP, session=self.session))
+        hand.add_interval(EXCLUSIONMS_IP, interval1, session=self.session)
+        self.assertEqual(1, hand.get_len(EXCLUSIONMS_IP, session=self.session))
+        is_excluded = hand.inclusion_search_point(EXCLUSIONMS_IP, point1, session=self.session)
         self.assertEqual(False, is_excluded)
 
     def test_status_search_point(self):
-        hand.clear(EXCLUSIONMS_IP)
-        self.assertEqual(0, hand.get_len(EXCLUSIONMS_IP))
-        hand.add_interval(EXCLUSIONMS_IP, interval1)
-        self.assertEqual(1, hand.get_len(EXCLUSIONMS_IP))
-        is_excluded = hand.status_search_point(EXCLUSIONMS_IP, point1)
+        hand.clear(EXCLUSIONMS_IP, session=self.session)
+        self.assertEqual(0, hand.get_len(EXCLUSIONMS_IP, session=self.session))
+        hand.add_interval(EXCLUSIONMS_IP, interval1, session=self.session)
+        self.assertEqual(1, hand.get_len(EXCLUSIONMS_IP, session=self.session))
+        is_excluded = hand.status_search_point(EXCLUSIONMS_IP, point1, session=self.session)
         self.assertEqual(False, is_excluded)
 
     def test_exclusion_search_points(self):
-        hand.clear(EXCLUSIONMS_IP)
-        self.assertEqual(0, hand.get_len(EXCLUSIONMS_IP))
-        hand.add_intervals(EXCLUSIONMS_IP, [interval1, interval2])
-        self.assertEqual(2, hand.get_len(EXCLUSIONMS_IP))
-        intervals = hand.exclusion_search_points(EXCLUSIONMS_IP, [point1, point1])
+        hand.clear(EXCLUSIONMS_IP, session=self.session)
+        self.assertEqual(0, hand.get_len(EXCLUSIONMS_IP, session=self.session))
+        hand.add_intervals(EXCLUSIONMS_IP, [interval1, interval2], session=self.session)
+        self.assertEqual(2, hand.get_len(EXCLUSIONMS_IP, session=self.session))
+        intervals = hand.exclusion_search_points(EXCLUSIONMS_IP, [point1, point1], session=self.session)
         self.assertEqual(2, len(intervals))
         self.assertEqual(True, intervals[0])
         self.assertEqual(True, intervals[0])
 
-        intervals = hand.exclusion_search_points(EXCLUSIONMS_IP, [point1, point1], batch=True)
+        intervals = hand.exclusion_search_points(EXCLUSIONMS_IP, [point1, point1], batch=True, session=self.session)
         self.assertEqual(2, len(intervals))
         self.assertEqual(True, intervals[0])
         self.assertEqual(True, intervals[0])
 
-        intervals = hand.exclusion_search_points(EXCLUSIONMS_IP, [point1, point1], batch=True, use_ujson=True)
+        intervals = hand.exclusion_search_points(EXCLUSIONMS_IP, [point1, point1], batch=True, use_ujson=True,
+                                                 session=self.session)
         self.assertEqual(2, len(intervals))
         self.assertEqual(True, intervals[0])
         self.assertEqual(True, intervals[0])
 
     def test_inclusion_search_points(self):
-        hand.clear(EXCLUSIONMS_IP)
-        self.assertEqual(0, hand.get_len(EXCLUSIONMS_IP))
-        hand.add_intervals(EXCLUSIONMS_IP, [interval1, interval2])
-        self.assertEqual(2, hand.get_len(EXCLUSIONMS_IP))
+        hand.clear(EXCLUSIONMS_IP, session=self.session)
+        self.assertEqual(0, hand.get_len(EXCLUSIONMS_IP, session=self.session))
+        hand.add_intervals(EXCLUSIONMS_IP, [interval1, interval2], session=self.session)
+        self.assertEqual(2, hand.get_len(EXCLUSIONMS_IP, session=self.session))
 
-        intervals = hand.inclusion_search_points(EXCLUSIONMS_IP, [point1, point1])
+        intervals = hand.inclusion_search_points(EXCLUSIONMS_IP, [point1, point1], session=self.session)
         self.assertEqual(2, len(intervals))
         self.assertEqual(False, intervals[0])
         self.assertEqual(False, intervals[0])
 
-        intervals = hand.inclusion_search_points(EXCLUSIONMS_IP, [point1, point1], batch=True)
+        intervals = hand.inclusion_search_points(EXCLUSIONMS_IP, [point1, point1], batch=True, session=self.session)
         self.assertEqual(2, len(intervals))
         self.assertEqual(False, intervals[0])
         self.assertEqual(False, intervals[0])
 
-        intervals = hand.inclusion_search_points(EXCLUSIONMS_IP, [point1, point1], batch=True, use_ujson=True)
+        intervals = hand.inclusion_search_points(EXCLUSIONMS_IP, [point1, point1], batch=True, use_ujson=True,
+                                                 session=self.session)
         self.assertEqual(2, len(intervals))
         self.assertEqual(False, intervals[0])
         self.assertEqual(False, intervals[0])
 
     def test_points_status(self):
-        hand.clear(EXCLUSIONMS_IP)
-        self.assertEqual(0, hand.get_len(EXCLUSIONMS_IP))
-        hand.add_intervals(EXCLUSIONMS_IP, [interval1, interval2])
-        self.assertEqual(2, hand.get_len(EXCLUSIONMS_IP))
+        hand.clear(EXCLUSIONMS_IP, session=self.session)
+        self.assertEqual(0, hand.get_len(EXCLUSIONMS_IP, session=self.session))
+        hand.add_intervals(EXCLUSIONMS_IP, [interval1, interval2], session=self.session)
+        self.assertEqual(2, hand.get_len(EXCLUSIONMS_IP, session=self.session))
 
-        intervals = hand.status_search_points(EXCLUSIONMS_IP, [point1, point1])
+        intervals = hand.status_search_points(EXCLUSIONMS_IP, [point1, point1], session=self.session)
         self.assertEqual(2, len(intervals))
         self.assertEqual(False, intervals[0])
         self.assertEqual(False, intervals[0])
 
-        intervals = hand.status_search_points(EXCLUSIONMS_IP, [point1, point1], batch=True)
+        intervals = hand.status_search_points(EXCLUSIONMS_IP, [point1, point1], batch=True, session=self.session)
         self.assertEqual(2, len(intervals))
         self.assertEqual(False, intervals[0])
         self.assertEqual(False, intervals[0])
 
-        intervals = hand.status_search_points(EXCLUSIONMS_IP, [point1, point1], batch=True, use_ujson=True)
+        intervals = hand.status_search_points(EXCLUSIONMS_IP, [point1, point1], batch=True, use_ujson=True,
+                                              session=self.session)
         self.assertEqual(2, len(intervals))
         self.assertEqual(False, intervals[0])
         self.assertEqual(False, intervals[0])
 
 
+class TestExclusionListAsync(unittest.IsolatedAsyncioTestCase):
+
+    async def test_search_intervals(self):
+        await ahand.clear(EXCLUSIONMS_IP)
+        await ahand.add_intervals(EXCLUSIONMS_IP, [interval1, interval2, interval3])
+        length, intervals = await asyncio.gather(
+            ahand.get_len(EXCLUSIONMS_IP),
+            ahand.search_intervals(EXCLUSIONMS_IP, [interval1, interval2, interval3, interval4]))
+        self.assertEqual(3, length)
+        self.assertEqual([1, 1, 1, 0], [len(i) for i in intervals])
+
+    async def test_search_points(self):
+        await ahand.clear(EXCLUSIONMS_IP)
+        await ahand.add_intervals(EXCLUSIONMS_IP, [interval1, interval2])
+        length, intervals, excluded = await asyncio.gather(
+            ahand.get_len(EXCLUSIONMS_IP),
+            ahand.search_points(EXCLUSIONMS_IP, [point1, point1]),
+            ahand.exclusion_search_points(EXCLUSIONMS_IP, [point1, point1], batch=True))
+        self.assertEqual(2, length)
+        self.assertEqual([1, 1], [len(i) for i in intervals])
+        self.assertEqual([True, True], excluded)
+
+
 if __name__ == '__main__':
     unittest.main()
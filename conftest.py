@@ -0,0 +1,15 @@
+import pytest
+
+
+def pytest_addoption(parser):
+    parser.addoption('--run-integration', action='store_true', default=False,
+                     help='run integration tests, which require a running ExclusionMSAPI server')
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption('--run-integration'):
+        return
+    skip_integration = pytest.mark.skip(reason='needs --run-integration (and a running ExclusionMSAPI server)')
+    for item in items:
+        if 'integration' in item.keywords:
+            item.add_marker(skip_integration)
@@ -8,7 +8,7 @@ import logging
 import time
 from dataclasses import dataclass
 from math import ceil
-from typing import List, Dict
+from typing import List, Dict, Union, Any
 from functools import wraps
 
 import requests
@@ -42,13 +42,28 @@ def timer_decorator(func):
     return wrapper
 
 
+def _http(session: requests.Session = None):
+    """Returns the object to issue HTTP requests with.
+
+    Args:
+        session: (Optional) A requests.Session, whose pooled connections are reused across calls. Sessions are not
+            thread-safe, so one session must not be used by calls running in different threads at the same time.
+
+    Returns:
+        The session if one is given, otherwise the requests module (a new connection per call).
+
+    """
+    return requests if session is None else session
+
+
 @timer_decorator
-def clear(exclusion_api_ip: str, timeout=None) -> int:
+def clear(exclusion_api_ip: str, timeout=None, session=None) -> int:
     """Clears the exclusion list.
 
     Args:
         exclusion_api_ip: The IP address of the exclusion API.
         timeout: (Optional) The timeout for the API request.
+        session: (Optional) A requests.Session to reuse connections across calls.
 
     Returns:
         The number of exclusions that were cleared.
@@ -57,73 +72,77 @@ def clear(exclusion_api_ip: str, timeout=None) -> int:
         HTTPError: If the API request returns an error status code.
 
     """
-    response = requests.post(url=f'{exclusion_api_ip}/exclusionms/clear',
-                             timeout=timeout)
+    response = _http(session).post(url=f'{exclusion_api_ip}/exclusionms/clear',
+                                   timeout=timeout)
     response.raise_for_status()
     return json.loads(response.content)
 
 
 @timer_decorator
-def load(exclusion_api_ip: str, exid: str, timeout=None):
+def load(exclusion_api_ip: str, exid: str, timeout=None, session=None):
     """Loads an exclusion list with the specified ID.
 
     Args:
         exclusion_api_ip: The IP address of the exclusion API.
         exid: The ID of the exclusion list to load.
         timeout: (Optional) The timeout for the API request.
+        session: (Optional) A requests.Session to reuse connections across calls.
 
     Raises:
         HTTPError: If the API request returns an error status code.
 
     """
-    response = requests.post(url=f'{exclusion_api_ip}/exclusionms/load?exid={exid}',
-                             timeout=timeout)
+    response = _http(session).post(url=f'{exclusion_api_ip}/exclusionms/load?exid={exid}',
+                                   timeout=timeout)
     response.raise_for_status()
 
 
 @timer_decorator
-def save(exclusion_api_ip: str, exid: str, timeout=None):
+def save(exclusion_api_ip: str, exid: str, timeout=None, session=None):
     """Saves the exclusion list with the specified ID.
 
     Args:
         exclusion_api_ip: The IP address of the exclusion API.
         exid: The ID of the exclusion list to save.
         timeout: (Optional) The timeout for the API request.
+        session: (Optional) A requests.Session to reuse connections across calls.
 
     Raises:
         HTTPError: If the API request returns an error status code.
 
     """
-    response = requests.post(url=f'{exclusion_api_ip}/exclusionms/save?exid={exid}',
-                             timeout=timeout)
+    response = _http(session).post(url=f'{exclusion_api_ip}/exclusionms/save?exid={exid}',
+                                   timeout=timeout)
     response.raise_for_status()
 
 
 @timer_decorator
-def delete(exclusion_api_ip: str, exid: str, timeout=None):
+def delete(exclusion_api_ip: str, exid: str, timeout=None, session=None):
     """Deletes the exclusion list with the specified ID.
 
     Args:
         exclusion_api_ip: The IP address of the exclusion API.
         exid: The ID of the exclusion list to delete.
         timeout: (Optional) The timeout for the API request.
+        session: (Optional) A requests.Session to reuse connections across calls.
 
     Raises:
         HTTPError: If the API request returns an error status code.
 
     """
-    response = requests.post(url=f'{exclusion_api_ip}/exclusionms/delete?exid={exid}',
-                             timeout=timeout)
+    response = _http(session).post(url=f'{exclusion_api_ip}/exclusionms/delete?exid={exid}',
+                                   timeout=timeout)
     response.raise_for_status()
 
 
 @timer_decorator
-def get_statistics(exclusion_api_ip: str, timeout=None) -> Dict:
+def get_statistics(exclusion_api_ip: str, timeout=None, session=None) -> Dict:
     """Gets statistics about the exclusion list.
 
     Args:
         exclusion_api_ip: The IP address of the exclusion API.
         timeout: (Optional) The timeout for the API request.
+        session: (Optional) A requests.Session to reuse connections across calls.
 
     Returns:
         A dictionary containing statistics about the exclusion list.
@@ -132,20 +151,21 @@ def get_statistics(exclusion_api_ip: str, timeout=None) -> Dict:
         HTTPError: If the API request returns an error status code.
 
     """
-    response = requests.get(url=f'{exclusion_api_ip}/exclusionms/statistics',
-                            timeout=timeout)
+    response = _http(session).get(url=f'{exclusion_api_ip}/exclusionms/statistics',
+                                  timeout=timeout)
     response.raise_for_status()
 
     return json.loads(response.content)
 
 
 @timer_decorator
-def get_len(exclusion_api_ip: str, timeout=None) -> Dict:
+def get_len(exclusion_api_ip: str, timeout=None, session=None) -> Dict:
     """Gets the length of the exclusion list.
 
     Args:
         exclusion_api_ip: The IP address of the exclusion API.
         timeout: (Optional) The timeout for the API request.
+        session: (Optional) A requests.Session to reuse connections across calls.
 
     Returns:
         A dictionary containing the length of the exclusion list.
@@ -154,16 +174,17 @@ def get_len(exclusion_api_ip: str, timeout=None) -> Dict:
         HTTPError: If the API request returns an error status code.
 
     """
-    return get_statistics(exclusion_api_ip, timeout)['interval_tree']
+    return get_statistics(exclusion_api_ip, timeout, session)['interval_tree']
 
 
 @timer_decorator
-def get_files(exclusion_api_ip: str, timeout=None) -> List[str]:
+def get_files(exclusion_api_ip: str, timeout=None, session=None) -> List[str]:
     """Gets a list of files associated with the exclusion list.
 
     Args:
         exclusion_api_ip: The IP address of the exclusion API.
         timeout: (Optional) The timeout for the API request.
+        session: (Optional) A requests.Session to reuse connections across calls.
 
     Returns:
         A list of files associated with the exclusion list.
@@ -172,27 +193,28 @@ def get_files(exclusion_api_ip: str, timeout=None) -> List[str]:
         HTTPError: If the API request returns an error status code.
 
     """
-    response = requests.get(url=f'{exclusion_api_ip}/exclusionms/file',
-                            timeout=timeout)
+    response = _http(session).get(url=f'{exclusion_api_ip}/exclusionms/file',
+                                  timeout=timeout)
     response.raise_for_status()
     return json.loads(response.content)
 
 
-def add_interval(exclusion_api_ip: str, exclusion_interval: ExclusionInterval, timeout=None) -> None:
+def add_interval(exclusion_api_ip: str, exclusion_interval: ExclusionInterval, timeout=None, session=None) -> None:
     """Adds a single exclusion interval to the exclusion list.
 
     Args:
         exclusion_api_ip: The IP address of the exclusion API.
         exclusion_interval: The exclusion interval to add.
         timeout: (Optional) The timeout for the API request.
+        session: (Optional) A requests.Session to reuse connections across calls.
 
     """
-    add_intervals(exclusion_api_ip, [exclusion_interval], timeout)
+    add_intervals(exclusion_api_ip, [exclusion_interval], timeout, session=session)
 
 
 @timer_decorator
 def add_intervals(exclusion_api_ip: str, exclusion_intervals: List[ExclusionInterval], timeout=None,
-                  use_ujson=False, batch_size: int = None) -> None:
+                  use_ujson=False, batch_size: int = None, session=None) -> None:
     """Adds multiple exclusion intervals to the exclusion list.
 
     Args:
@@ -201,6 +223,7 @@ def add_intervals(exclusion_api_ip: str, exclusion_intervals: List[ExclusionInte
         timeout: (Optional) The timeout for the API request.
         use_ujson: (Optional) Whether to use ujson instead of the standard JSON library.
         batch_size: (Optional) The batch size for adding intervals in batches.
+        session: (Optional) A requests.Session to reuse connections across calls.
 
     Raises:
         HTTPError: If the API request returns an error status code.
@@ -218,44 +241,78 @@ def add_intervals(exclusion_api_ip: str, exclusion_intervals: List[ExclusionInte
         batch_intervals = exclusion_intervals[batch_start:batch_end]
 
         if use_ujson:
-            response = requests.post(url=f'{exclusion_api_ip}/exclusionms/intervals',
-                                     data=ujson.dumps([interval.dict() for interval in batch_intervals]),
-                                     timeout=timeout)
+            response = _http(session).post(url=f'{exclusion_api_ip}/exclusionms/intervals',
+                                           data=ujson.dumps([interval.dict() for interval in batch_intervals]),
+                                           timeout=timeout)
         else:
-            response = requests.post(url=f'{exclusion_api_ip}/exclusionms/intervals',
-                                     json=[interval.dict() for interval in batch_intervals],
-                                     timeout=timeout)
+            response = _http(session).post(url=f'{exclusion_api_ip}/exclusionms/intervals',
+                                           json=[interval.dict() for interval in batch_intervals],
+                                           timeout=timeout)
 
         response.raise_for_status()
 
 
+@timer_decorator
+def post_raw(exclusion_api_ip: str, endpoint: str, data: Union[str, bytes], timeout=None, session=None) -> Any:
+    """Posts an already serialized JSON body to an exclusion API endpoint.
+
+    Useful when the same payload is sent repeatedly: the body is serialized once by the caller (e.g. with
+    ujson.dumps([interval.dict() for interval in intervals])) instead of on every request.
+
+    Args:
+        exclusion_api_ip: The IP address of the exclusion API.
+        endpoint: The endpoint path, e.g. '/exclusionms/intervals'.
+        data: The serialized JSON body.
+        timeout: (Optional) The timeout for the API request.
+        session: (Optional) A requests.Session to reuse connections across calls.
+
+    Returns:
+        The decoded JSON response, or None if the response has no content.
+
+    Raises:
+        HTTPError: If the API request returns an error status code.
+
+    """
+    response = _http(session).post(url=f'{exclusion_api_ip}{endpoint}',
+                                   data=data,
+                                   headers={'Content-Type': 'application/json'},
+                                   timeout=timeout)
+    response.raise_for_status()
+
+    if not response.content:
+        return None
+    return json.loads(response.content)
+
+
 def search_interval(exclusion_api_ip: str,
                     exclusion_interval: ExclusionInterval,
-                    timeout=None) -> List[ExclusionInterval]:
+                    timeout=None, session=None) -> List[ExclusionInterval]:
     """Searches for a single exclusion interval in the exclusion list.
 
     Args:
         exclusion_api_ip: The IP address of the exclusion API.
         exclusion_interval: The exclusion interval to search for.
         timeout: (Optional) The timeout for the API request.
+        session: (Optional) A requests.Session to reuse connections across calls.
 
     Returns:
         A list of exclusion intervals that match the search criteria.
 
     """
-    return search_intervals(exclusion_api_ip, [exclusion_interval], timeout)[0]
+    return search_intervals(exclusion_api_ip, [exclusion_interval], timeout, session)[0]
 
 
 @timer_decorator
 def search_intervals(exclusion_api_ip: str,
                      exclusion_intervals: List[ExclusionInterval],
-                     timeout=None) -> List[List[ExclusionInterval]]:
+                     timeout=None, session=None) -> List[List[ExclusionInterval]]:
     """Searches for multiple exclusion intervals in the exclusion list.
 
     Args:
         exclusion_api_ip: The IP address of the exclusion API.
         exclusion_intervals: The exclusion intervals to search for.
         timeout: (Optional) The timeout for the API request.
+        session: (Optional) A requests.Session to reuse connections across calls.
 
     Returns:
         A list of lists of exclusion intervals that match the search criteria.
@@ -264,9 +321,9 @@ def search_intervals(exclusion_api_ip: str,
         HTTPError: If the API request returns an error status code.
 
     """
-    response = requests.post(url=f'{exclusion_api_ip}/exclusionms/intervals/search',
-                             json=[interval.dict() for interval in exclusion_intervals],
-                             timeout=timeout)
+    response = _http(session).post(url=f'{exclusion_api_ip}/exclusionms/intervals/search',
+                                   json=[interval.dict() for interval in exclusion_intervals],
+                                   timeout=timeout)
 
     response.raise_for_status()
 
@@ -277,31 +334,33 @@ def search_intervals(exclusion_api_ip: str,
 
 def delete_interval(exclusion_api_ip: str,
                     exclusion_interval: ExclusionInterval,
-                    timeout=None) -> List[ExclusionInterval]:
+                    timeout=None, session=None) -> List[ExclusionInterval]:
     """Deletes a single exclusion interval from the exclusion list.
 
     Args:
         exclusion_api_ip: The IP address of the exclusion API.
         exclusion_interval: The exclusion interval to delete.
         timeout: (Optional) The timeout for the API request.
+        session: (Optional) A requests.Session to reuse connections across calls.
 
     Returns:
         A list of exclusion intervals that were deleted.
 
     """
-    return delete_intervals(exclusion_api_ip, [exclusion_interval], timeout)[0]
+    return delete_intervals(exclusion_api_ip, [exclusion_interval], timeout, session)[0]
 
 
 @timer_decorator
 def delete_intervals(exclusion_api_ip: str,
                      exclusion_intervals: List[ExclusionInterval],
-                     timeout=None) -> List[List[ExclusionInterval]]:
+                     timeout=None, session=None) -> List[List[ExclusionInterval]]:
     """Deletes multiple exclusion intervals from the exclusion list.
 
     Args:
         exclusion_api_ip: The IP address of the exclusion API.
         exclusion_intervals: The exclusion intervals to delete.
         timeout: (Optional) The timeout for the API request.
+        session: (Optional) A requests.Session to reuse connections across calls.
 
     Returns:
         A list of lists of exclusion intervals that were deleted.
@@ -310,9 +369,9 @@ def delete_intervals(exclusion_api_ip: str,
         HTTPError: If the API request returns an error status code.
 
     """
-    response = requests.delete(url=f'{exclusion_api_ip}/exclusionms/intervals',
-                               json=[interval.dict() for interval in exclusion_intervals],
-                               timeout=timeout)
+    response = _http(session).delete(url=f'{exclusion_api_ip}/exclusionms/intervals',
+                                     json=[interval.dict() for interval in exclusion_intervals],
+                                     timeout=timeout)
 
     response.raise_for_status()
 
@@ -323,31 +382,33 @@ def delete_intervals(exclusion_api_ip: str,
 
 def search_point(exclusion_api_ip: str,
                  exclusion_point: ExclusionPoint,
-                 timeout=None) -> List[ExclusionInterval]:
+                 timeout=None, session=None) -> List[ExclusionInterval]:
     """Searches a single exclusion point in the exclusion list.
 
     Args:
         exclusion_api_ip: The IP address of the exclusion API.
         exclusion_point: The exclusion point to search for.
         timeout: (Optional) The timeout for the API request.
+        session: (Optional) A requests.Session to reuse connections across calls.
 
     Returns:
         A list of exclusion intervals that contain the exclusion point.
 
     """
-    return search_points(exclusion_api_ip, [exclusion_point], timeout)[0]
+    return search_points(exclusion_api_ip, [exclusion_point], timeout, session=session)[0]
 
 
 @timer_decorator
 def search_points(exclusion_api_ip: str,
                   exclusion_points: List[ExclusionPoint],
-                  timeout=None) -> List[List[ExclusionInterval]]:
+                  timeout=None, session=None) -> List[List[ExclusionInterval]]:
     """Searches multiple exclusion points in the exclusion list.
 
     Args:
         exclusion_api_ip: The IP address of the exclusion API.
         exclusion_points: The exclusion points to search for.
         timeout: (Optional) The timeout for the API request.
+        session: (Optional) A requests.Session to reuse connections across calls.
 
     Returns:
         A list of lists of exclusion intervals that contain the exclusion points.
@@ -356,9 +417,9 @@ def search_points(exclusion_api_ip: str,
         HTTPError: If the API request returns an error status code.
 
     """
-    response = requests.post(url=f'{exclusion_api_ip}/exclusionms/points/search',
-                             json=[point.dict() for point in exclusion_points],
-                             timeout=timeout)
+    response = _http(session).post(url=f'{exclusion_api_ip}/exclusionms/points/search',
+                                   json=[point.dict() for point in exclusion_points],
+                                   timeout=timeout)
 
     response.raise_for_status()
 
@@ -368,52 +429,53 @@ def search_points(exclusion_api_ip: str,
 
 
 def _handle_batch(api_endpoint: str, exclusion_api_ip: str, exclusion_points: List[ExclusionPoint], timeout=None,
-                  use_ujson=False, batch=False) -> List[bool]:
+                  use_ujson=False, batch=False, session=None) -> List[bool]:
     if batch is True:
         batch_msg = ExclusionPointBatchMessage.create(points=exclusion_points)
         if use_ujson is True:
-            response = requests.post(url=f'{exclusion_api_ip}/exclusionms/points/{api_endpoint}_batch',
-                                     data=ujson.dumps(batch_msg.dict()),
-                                     timeout=timeout)
+            response = _http(session).post(url=f'{exclusion_api_ip}/exclusionms/points/{api_endpoint}_batch',
+                                           data=ujson.dumps(batch_msg.dict()),
+                                           timeout=timeout)
         else:
-            response = requests.post(url=f'{exclusion_api_ip}/exclusionms/points/{api_endpoint}_batch',
-                                     json=batch_msg.dict(),
-                                     timeout=timeout)
+            response = _http(session).post(url=f'{exclusion_api_ip}/exclusionms/points/{api_endpoint}_batch',
+                                           json=batch_msg.dict(),
+                                           timeout=timeout)
 
     else:
 
         if use_ujson is True:
-            response = requests.post(url=f'{exclusion_api_ip}/exclusionms/points/{api_endpoint}',
-                                     data=ujson.dumps([point.dict() for point in exclusion_points]),
-                                     timeout=timeout)
+            response = _http(session).post(url=f'{exclusion_api_ip}/exclusionms/points/{api_endpoint}',
+                                           data=ujson.dumps([point.dict() for point in exclusion_points]),
+                                           timeout=timeout)
         else:
-            response = requests.post(url=f'{exclusion_api_ip}/exclusionms/points/{api_endpoint}',
-                                     json=[point.dict() for point in exclusion_points],
-                                     timeout=timeout)
+            response = _http(session).post(url=f'{exclusion_api_ip}/exclusionms/points/{api_endpoint}',
+                                           json=[point.dict() for point in exclusion_points],
+                                           timeout=timeout)
 
     response.raise_for_status()
 
     return json.loads(response.content)
 
 
-def exclusion_search_point(exclusion_api_ip: str, exclusion_point: ExclusionPoint, timeout=None) -> bool:
+def exclusion_search_point(exclusion_api_ip: str, exclusion_point: ExclusionPoint, timeout=None, session=None) -> bool:
     """Checks if a single exclusion point is excluded.
 
     Args:
         exclusion_api_ip: The IP address of the exclusion API.
         exclusion_point: The exclusion point to check.
         timeout: (Optional) The timeout for the API request.
+        session: (Optional) A requests.Session to reuse connections across calls.
 
     Returns:
         True if the exclusion point is excluded, False otherwise.
 
     """
-    return exclusion_search_points(exclusion_api_ip, [exclusion_point], timeout)[0]
+    return exclusion_search_points(exclusion_api_ip, [exclusion_point], timeout, session=session)[0]
 
 
 @timer_decorator
 def exclusion_search_points(exclusion_api_ip: str, exclusion_points: List[ExclusionPoint], timeout=None,
-                            use_ujson=False, batch=False) -> List[bool]:
+                            use_ujson=False, batch=False, session=None) -> List[bool]:
     """Checks if multiple exclusion points are excluded.
 
     Args:
@@ -422,6 +484,7 @@ def exclusion_search_points(exclusion_api_ip: str, exclusion_points: List[Exclus
         timeout: (Optional) The timeout for the API request.
         use_ujson: (Optional) Whether to use ujson instead of the standard JSON library.
         batch: (Optional) Whether to use the batch endpoint.
+        session: (Optional) A requests.Session to reuse connections across calls.
 
     Returns:
         A list of booleans indicating whether the exclusion points are excluded.
@@ -432,27 +495,29 @@ def exclusion_search_points(exclusion_api_ip: str, exclusion_points: List[Exclus
     """
 
     return _handle_batch(api_endpoint='exclusion_search', exclusion_api_ip=exclusion_api_ip,
-                         exclusion_points=exclusion_points, timeout=timeout, use_ujson=use_ujson, batch=batch)
+                         exclusion_points=exclusion_points, timeout=timeout, use_ujson=use_ujson, batch=batch,
+                         session=session)
 
 
-def inclusion_search_point(exclusion_api_ip: str, exclusion_point: ExclusionPoint, timeout=None) -> bool:
+def inclusion_search_point(exclusion_api_ip: str, exclusion_point: ExclusionPoint, timeout=None, session=None) -> bool:
     """Checks if a single exclusion point is excluded.
 
     Args:
         exclusion_api_ip: The IP address of the exclusion API.
         exclusion_point: The exclusion point to check.
         timeout: (Optional) The timeout for the API request.
+        session: (Optional) A requests.Session to reuse connections across calls.
 
     Returns:
         True if the exclusion point is excluded, False otherwise.
 
     """
-    return inclusion_search_points(exclusion_api_ip, [exclusion_point], timeout)[0]
+    return inclusion_search_points(exclusion_api_ip, [exclusion_point], timeout, session=session)[0]
 
 
 @timer_decorator
 def inclusion_search_points(exclusion_api_ip: str, exclusion_points: List[ExclusionPoint], timeout=None,
-                            use_ujson=False, batch=False) -> List[bool]:
+                            use_ujson=False, batch=False, session=None) -> List[bool]:
     """Checks if multiple exclusion points are excluded.
 
     Args:
@@ -461,6 +526,7 @@ def inclusion_search_points(exclusion_api_ip: str, exclusion_points: List[Exclus
         timeout: (Optional) The timeout for the API request.
         use_ujson: (Optional) Whether to use ujson instead of the standard JSON library.
         batch: (Optional) Whether to use the batch endpoint.
+        session: (Optional) A requests.Session to reuse connections across calls.
 
     Returns:
         A list of booleans indicating whether the exclusion points are excluded.
@@ -471,27 +537,29 @@ def inclusion_search_points(exclusion_api_ip: str, exclusion_points: List[Exclus
     """
 
     return _handle_batch(api_endpoint='inclusion_search', exclusion_api_ip=exclusion_api_ip,
-                         exclusion_points=exclusion_points, timeout=timeout, use_ujson=use_ujson, batch=batch)
+                         exclusion_points=exclusion_points, timeout=timeout, use_ujson=use_ujson, batch=batch,
+                         session=session)
 
 
-def status_search_point(exclusion_api_ip: str, exclusion_point: ExclusionPoint, timeout=None) -> bool:
+def status_search_point(exclusion_api_ip: str, exclusion_point: ExclusionPoint, timeout=None, session=None) -> bool:
     """Checks if a single exclusion point is excluded.
 
     Args:
         exclusion_api_ip: The IP address of the exclusion API.
         exclusion_point: The exclusion point to check.
         timeout: (Optional) The timeout for the API request.
+        session: (Optional) A requests.Session to reuse connections across calls.
 
     Returns:
         True if the exclusion point is excluded, False otherwise.
 
     """
-    return status_search_points(exclusion_api_ip, [exclusion_point], timeout)[0]
+    return status_search_points(exclusion_api_ip, [exclusion_point], timeout, session=session)[0]
 
 
 @timer_decorator
 def status_search_points(exclusion_api_ip: str, exclusion_points: List[ExclusionPoint], timeout=None,
-                         use_ujson=False, batch=False) -> List[bool]:
+                         use_ujson=False, batch=False, session=None) -> List[bool]:
     """Checks if multiple exclusion points are excluded.
 
     Args:
@@ -500,6 +568,7 @@ def status_search_points(exclusion_api_ip: str, exclusion_points: List[Exclusion
         timeout: (Optional) The timeout for the API request.
         use_ujson: (Optional) Whether to use ujson instead of the standard JSON library.
         batch: (Optional) Whether to use the batch endpoint.
+        session: (Optional) A requests.Session to reuse connections across calls.
 
     Returns:
         A list of booleans indicating whether the exclusion points are excluded.
@@ -510,23 +579,25 @@ def status_search_points(exclusion_api_ip: str, exclusion_points: List[Exclusion
     """
 
     return _handle_batch(api_endpoint='status_search', exclusion_api_ip=exclusion_api_ip,
-                         exclusion_points=exclusion_points, timeout=timeout, use_ujson=use_ujson, batch=batch)
+                         exclusion_points=exclusion_points, timeout=timeout, use_ujson=use_ujson, batch=batch,
+                         session=session)
 
 
 @timer_decorator
-def is_connected(exclusion_api_ip: str, timeout=None) -> bool:
+def is_connected(exclusion_api_ip: str, timeout=None, session=None) -> bool:
     """Checks if the exclusion API is connected.
 
     Args:
         exclusion_api_ip: The IP address of the exclusion API.
         timeout: (Optional) The timeout for the API request.
+        session: (Optional) A requests.Session to reuse connections across calls.
 
     Returns:
         True if the exclusion API is connected, False otherwise.
 
     """
     try:
-        get_statistics(exclusion_api_ip, timeout)
+        get_statistics(exclusion_api_ip, timeout, session)
     except requests.exceptions.ConnectionError:
         return False
 
@@ -534,7 +605,7 @@ def is_connected(exclusion_api_ip: str, timeout=None) -> bool:
 
 
 @timer_decorator
-def load_or_clear_exclusion_list(exid: str, exclusionms_ip: str, timeout=None):
+def load_or_clear_exclusion_list(exid: str, exclusionms_ip: str, timeout=None, session=None):
     """Loads or clears the exclusion list with the specified ID.
 
     If the exclusion list with the specified ID exists, it is loaded. If it does not exist,
@@ -544,23 +615,25 @@ def load_or_clear_exclusion_list(exid: str, exclusionms_ip: str, timeout=None):
         exid: The ID of the exclusion list to load or clear.
         exclusionms_ip: The IP address of the exclusion API.
         timeout: (Optional) The timeout for the API request.
+        session: (Optional) A requests.Session to reuse connections across calls.
 
     """
-    available_exclusion_lists = get_files(exclusionms_ip, timeout)
+    available_exclusion_lists = get_files(exclusionms_ip, timeout, session)
     if exid not in available_exclusion_lists:
-        clear(exclusionms_ip, timeout)
+        clear(exclusionms_ip, timeout, session)
     else:
-        load(exclusionms_ip, exid, timeout)
+        load(exclusionms_ip, exid, timeout, session)
 
 
 @timer_decorator
-def get_log_entries(exclusionms_ip: str, num_entries: int = 500, timeout=None) -> {}:
+def get_log_entries(exclusionms_ip: str, num_entries: int = 500, timeout=None, session=None) -> {}:
     """Gets the most recent log entries.
 
     Args:
         exclusionms_ip: The IP address of the exclusion API.
         num_entries: (Optional) The number of log entries to retrieve.
         timeout: (Optional) The timeout for the API request.
+        session: (Optional) A requests.Session to reuse connections across calls.
 
     Returns:
         A dictionary containing the most recent log entries.
@@ -569,7 +642,7 @@ def get_log_entries(exclusionms_ip: str, num_entries: int = 500, timeout=None) -
         HTTPError: If the API request returns an error status code.
 
     """
-    response = requests.get(url=f'{exclusionms_ip}/logs/entries?num_entries={num_entries}', timeout=timeout)
+    response = _http(session).get(url=f'{exclusionms_ip}/logs/entries?num_entries={num_entries}', timeout=timeout)
     response.raise_for_status()
     return json.loads(response.content)
 
@@ -583,100 +656,109 @@ class Handler:
         timeout: The timeout for the API request.
         use_ujson: (Optional) Whether to use ujson instead of the default JSON library.
         batch_size: (Optional) The batch size to use for adding exclusion intervals.
+        session: (Optional) A requests.Session shared by all calls, so that connections are reused. Sessions are not
+            thread-safe, so a Handler with a session must not be used from several threads at once, nor have its
+            session passed to concurrent apihandler_async calls.
 
     """
     exclusion_api_ip: str
     timeout: float
     use_ujson: bool = False
     batch_size: int = None
+    session: requests.Session = None
 
     def clear(self) -> int:
         """Calls equivalent apihandler function with the Handlers attributes"""
-        return clear(self.exclusion_api_ip, self.timeout)
+        return clear(self.exclusion_api_ip, self.timeout, session=self.session)
 
     def load(self, exid: str):
         """Calls equivalent apihandler function with the Handlers attributes"""
-        return load(self.exclusion_api_ip, exid, self.timeout)
+        return load(self.exclusion_api_ip, exid, self.timeout, session=self.session)
 
     def save(self, exid: str):
         """Calls equivalent apihandler function with the Handlers attributes"""
-        return save(self.exclusion_api_ip, exid, self.timeout)
+        return save(self.exclusion_api_ip, exid, self.timeout, session=self.session)
 
     def delete(self, exid: str):
         """Calls equivalent apihandler function with the Handlers attributes"""
-        return delete(self.exclusion_api_ip, exid, self.timeout)
+        return delete(self.exclusion_api_ip, exid, self.timeout, session=self.session)
 
     def get_statistics(self) -> Dict:
         """Calls equivalent apihandler function with the Handlers attributes"""
-        return get_statistics(self.exclusion_api_ip, self.timeout)
+        return get_statistics(self.exclusion_api_ip, self.timeout, session=self.session)
 
     def get_len(self) -> Dict:
         """Calls equivalent apihandler function with the Handlers attributes"""
-        return get_len(self.exclusion_api_ip, self.timeout)
+        return get_len(self.exclusion_api_ip, self.timeout, session=self.session)
 
     def get_files(self) -> Dict:
         """Calls equivalent apihandler function with the Handlers attributes"""
-        return get_files(self.exclusion_api_ip, self.timeout)
+        return get_files(self.exclusion_api_ip, self.timeout, session=self.session)
 
     def add_interval(self, exclusion_interval: ExclusionInterval) -> None:
         """Calls equivalent apihandler function with the Handlers attributes"""
-        return add_interval(self.exclusion_api_ip, exclusion_interval)
+        return add_interval(self.exclusion_api_ip, exclusion_interval, session=self.session)
 
     def add_intervals(self, exclusion_intervals: List[ExclusionInterval]) -> None:
         """Calls equivalent apihandler function with the Handlers attributes"""
-        return add_intervals(self.exclusion_api_ip, exclusion_intervals, self.timeout, self.use_ujson, self.batch_size)
+        return add_intervals(self.exclusion_api_ip, exclusion_intervals, self.timeout, self.use_ujson, self.batch_size,
+                             session=self.session)
+
+    def post_raw(self, endpoint: str, data: Union[str, bytes]) -> Any:
+        """Calls equivalent apihandler function with the Handlers attributes"""
+        return post_raw(self.exclusion_api_ip, endpoint, data, self.timeout, session=self.session)
 
     def search_interval(self, exclusion_interval: ExclusionInterval) -> List[ExclusionInterval]:
         """Calls equivalent apihandler function with the Handlers attributes"""
-        return search_interval(self.exclusion_api_ip, exclusion_interval, self.timeout)
+        return search_interval(self.exclusion_api_ip, exclusion_interval, self.timeout, session=self.session)
 
     def search_intervals(self, exclusion_intervals: List[ExclusionInterval]) -> List[ExclusionInterval]:
         """Calls equivalent apihandler function with the Handlers attributes"""
-        return search_intervals(self.exclusion_api_ip, exclusion_intervals, self.timeout)
+        return search_intervals(self.exclusion_api_ip, exclusion_intervals, self.timeout, session=self.session)
 
     def delete_interval(self, exclusion_interval: ExclusionInterval) -> List[ExclusionInterval]:
         """Calls equivalent apihandler function with the Handlers attributes"""
-        return delete_interval(self.exclusion_api_ip, exclusion_interval, self.timeout)
+        return delete_interval(self.exclusion_api_ip, exclusion_interval, self.timeout, session=self.session)
 
     def delete_intervals(self, exclusion_intervals: List[ExclusionInterval]) -> List[List[ExclusionInterval]]:
         """Calls equivalent apihandler function with the Handlers attributes"""
-        return delete_intervals(self.exclusion_api_ip, exclusion_intervals, self.timeout)
+        return delete_intervals(self.exclusion_api_ip, exclusion_intervals, self.timeout, session=self.session)
 
     def search_point(self, exclusion_point: ExclusionPoint) -> List[ExclusionInterval]:
         """Calls equivalent apihandler function with the Handlers attributes"""
-        return search_point(self.exclusion_api_ip, exclusion_point, self.timeout)
+        return search_point(self.exclusion_api_ip, exclusion_point, self.timeout, session=self.session)
 
     def search_points(self, exclusion_points: List[ExclusionPoint]) -> List[List[ExclusionInterval]]:
         """Calls equivalent apihandler function with the Handlers attributes"""
-        return search_points(self.exclusion_api_ip, exclusion_points, self.timeout)
+        return search_points(self.exclusion_api_ip, exclusion_points, self.timeout, session=self.session)
 
     def exclusion_search_point(self, exclusion_point: ExclusionPoint) -> bool:
         """Calls equivalent apihandler function with the Handlers attributes"""
-        return exclusion_search_point(self.exclusion_api_ip, exclusion_point, self.timeout)
+        return exclusion_search_point(self.exclusion_api_ip, exclusion_point, self.timeout, session=self.session)
 
     def exclusion_search_points(self, exclusion_points: List[ExclusionPoint]) -> List[bool]:
         """Calls equivalent apihandler function with the Handlers attributes"""
-        return exclusion_search_points(self.exclusion_api_ip, exclusion_points, self.timeout)
+        return exclusion_search_points(self.exclusion_api_ip, exclusion_points, self.timeout, session=self.session)
 
     def inclusion_search_point(self, exclusion_point: ExclusionPoint) -> bool:
         """Calls equivalent apihandler function with the Handlers attributes"""
-        return inclusion_search_point(self.exclusion_api_ip, exclusion_point, self.timeout)
+        return inclusion_search_point(self.exclusion_api_ip, exclusion_point, self.timeout, session=self.session)
 
     def inclusion_search_points(self, exclusion_points: List[ExclusionPoint]) -> List[bool]:
         """Calls equivalent apihandler function with the Handlers attributes"""
-        return inclusion_search_points(self.exclusion_api_ip, exclusion_points, self.timeout)
+        return inclusion_search_points(self.exclusion_api_ip, exclusion_points, self.timeout, session=self.session)
 
     def status_search_point(self, exclusion_point: ExclusionPoint) -> bool:
         """Calls equivalent apihandler function with the Handlers attributes"""
-        return status_search_point(self.exclusion_api_ip, exclusion_point, self.timeout)
+        return status_search_point(self.exclusion_api_ip, exclusion_point, self.timeout, session=self.session)
 
     def status_search_points(self, exclusion_points: List[ExclusionPoint]) -> List[bool]:
         """Calls equivalent apihandler function with the Handlers attributes"""
-        return status_search_points(self.exclusion_api_ip, exclusion_points, self.timeout)
+        return status_search_points(self.exclusion_api_ip, exclusion_points, self.timeout, session=self.session)
 
     def is_connected(self) -> bool:
         """Calls equivalent apihandler function with the Handlers attributes"""
-        return is_connected(self.exclusion_api_ip, self.timeout)
+        return is_connected(self.exclusion_api_ip, self.timeout, session=self.session)
 
     def load_or_clear_exclusion_list(self):
         """Calls equivalent apihandler function with the Handlers attributes"""
@@ -684,4 +766,4 @@ class Handler:
 
     def get_log_entries(self, num_entries: int = 500) -> {}:
         """Calls equivalent apihandler function with the Handlers attributes"""
-        return get_log_entries(self.exclusion_api_ip, num_entries, self.timeout)
+        return get_log_entries(self.exclusion_api_ip, num_entries, self.timeout, session=self.session)
@@ -0,0 +1,142 @@
+"""
+This module provides asyncio variants of the exclusionms.apihandler functions. Each call is run in the event loop's
+default executor, so that independent API calls (e.g. get_len and search_intervals) can be issued concurrently with
+asyncio.gather instead of waiting for each round trip in turn.
+
+Calls gathered this way run at the same time in different threads. requests.Session is not thread-safe, so a session
+must not be shared by async calls that may run concurrently: give each concurrent call its own session, or pass no
+session (each call then opens its own connection).
+"""
+
+import asyncio
+from functools import partial
+from typing import List, Dict, Callable, Any
+
+from . import apihandler
+from .components import ExclusionPoint, ExclusionInterval
+
+
+async def _run(func: Callable, *args, **kwargs) -> Any:
+    """Runs a blocking apihandler function in the default executor of the running event loop.
+
+    Args:
+        func: The apihandler function to run.
+        *args: Positional arguments passed to the function.
+        **kwargs: Keyword arguments passed to the function.
+
+    Returns:
+        The return value of the function.
+
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, partial(func, *args, **kwargs))
+
+
+async def clear(exclusion_api_ip: str, timeout=None, session=None) -> int:
+    """Async variant of apihandler.clear"""
+    return await _run(apihandler.clear, exclusion_api_ip, timeout, session=session)
+
+
+async def load(exclusion_api_ip: str, exid: str, timeout=None, session=None):
+    """Async variant of apihandler.load"""
+    return await _run(apihandler.load, exclusion_api_ip, exid, timeout, session=session)
+
+
+async def save(exclusion_api_ip: str, exid: str, timeout=None, session=None):
+    """Async variant of apihandler.save"""
+    return await _run(apihandler.save, exclusion_api_ip, exid, timeout, session=session)
+
+
+async def delete(exclusion_api_ip: str, exid: str, timeout=None, session=None):
+    """Async variant of apihandler.delete"""
+    return await _run(apihandler.delete, exclusion_api_ip, exid, timeout, session=session)
+
+
+async def get_statistics(exclusion_api_ip: str, timeout=None, session=None) -> Dict:
+    """Async variant of apihandler.get_statistics"""
+    return await _run(apihandler.get_statistics, exclusion_api_ip, timeout, session=session)
+
+
+async def get_len(exclusion_api_ip: str, timeout=None, session=None) -> int:
+    """Async variant of apihandler.get_len"""
+    return await _run(apihandler.get_len, exclusion_api_ip, timeout, session=session)
+
+
+async def get_files(exclusion_api_ip: str, timeout=None, session=None) -> List[str]:
+    """Async variant of apihandler.get_files"""
+    return await _run(apihandler.get_files, exclusion_api_ip, timeout, session=session)
+
+
+async def add_interval(exclusion_api_ip: str, exclusion_interval: ExclusionInterval, timeout=None,
+                       session=None) -> None:
+    """Async variant of apihandler.add_interval"""
+    return await _run(apihandler.add_interval, exclusion_api_ip, exclusion_interval, timeout, session=session)
+
+
+async def add_intervals(exclusion_api_ip: str, exclusion_intervals: List[ExclusionInterval], timeout=None,
+                        use_ujson=False, batch_size: int = None, session=None) -> None:
+    """Async variant of apihandler.add_intervals"""
+    return await _run(apihandler.add_intervals, exclusion_api_ip, exclusion_intervals, timeout, use_ujson,
+                      batch_size, session=session)
+
+
+async def search_interval(exclusion_api_ip: str, exclusion_interval: ExclusionInterval,
+                          timeout=None, session=None) -> List[ExclusionInterval]:
+    """Async variant of apihandler.search_interval"""
+    return await _run(apihandler.search_interval, exclusion_api_ip, exclusion_interval, timeout, session=session)
+
+
+async def search_intervals(exclusion_api_ip: str, exclusion_intervals: List[ExclusionInterval],
+                           timeout=None, session=None) -> List[List[ExclusionInterval]]:
+    """Async variant of apihandler.search_intervals"""
+    return await _run(apihandler.search_intervals, exclusion_api_ip, exclusion_intervals, timeout, session=session)
+
+
+async def delete_interval(exclusion_api_ip: str, exclusion_interval: ExclusionInterval,
+                          timeout=None, session=None) -> List[ExclusionInterval]:
+    """Async variant of apihandler.delete_interval"""
+    return await _run(apihandler.delete_interval, exclusion_api_ip, exclusion_interval, timeout, session=session)
+
+
+async def delete_intervals(exclusion_api_ip: str, exclusion_intervals: List[ExclusionInterval],
+                           timeout=None, session=None) -> List[List[ExclusionInterval]]:
+    """Async variant of apihandler.delete_intervals"""
+    return await _run(apihandler.delete_intervals, exclusion_api_ip, exclusion_intervals, timeout, session=session)
+
+
+async def search_point(exclusion_api_ip: str, exclusion_point: ExclusionPoint,
+                       timeout=None, session=None) -> List[ExclusionInterval]:
+    """Async variant of apihandler.search_point"""
+    return await _run(apihandler.search_point, exclusion_api_ip, exclusion_point, timeout, session=session)
+
+
+async def search_points(exclusion_api_ip: str, exclusion_points: List[ExclusionPoint],
+                        timeout=None, session=None) -> List[List[ExclusionInterval]]:
+    """Async variant of apihandler.search_points"""
+    return await _run(apihandler.search_points, exclusion_api_ip, exclusion_points, timeout, session=session)
+
+
+async def exclusion_search_points(exclusion_api_ip: str, exclusion_points: List[ExclusionPoint], timeout=None,
+                                  use_ujson=False, batch=False, session=None) -> List[bool]:
+    """Async variant of apihandler.exclusion_search_points"""
+    return await _run(apihandler.exclusion_search_points, exclusion_api_ip, exclusion_points, timeout, use_ujson,
+                      batch, session=session)
+
+
+async def inclusion_search_points(exclusion_api_ip: str, exclusion_points: List[ExclusionPoint], timeout=None,
+                                  use_ujson=False, batch=False, session=None) -> List[bool]:
+    """Async variant of apihandler.inclusion_search_points"""
+    return await _run(apihandler.inclusion_search_points, exclusion_api_ip, exclusion_points, timeout, use_ujson,
+                      batch, session=session)
+
+
+async def status_search_points(exclusion_api_ip: str, exclusion_points: List[ExclusionPoint], timeout=None,
+                               use_ujson=False, batch=False, session=None) -> List[bool]:
+    """Async variant of apihandler.status_search_points"""
+    return await _run(apihandler.status_search_points, exclusion_api_ip, exclusion_points, timeout, use_ujson,
+                      batch, session=session)
+
+
+async def is_connected(exclusion_api_ip: str, timeout=None, session=None) -> bool:
+    """Async variant of apihandler.is_connected"""
+    return await _run(apihandler.is_connected, exclusion_api_ip, timeout, session=session)
@@ -16,22 +16,36 @@ Classes included in this module:
   for mass, retention time (rt), ook0, and intensity properties, as well as constructing an ExclusionInterval
   based on the calculated bounds.
 
+- ExclusionIntervalArray: A column-oriented (struct-of-arrays) representation of many ExclusionIntervals,
+  allowing bulk comparisons to be evaluated with vectorized NumPy operations.
+
+- ExclusionPointBatch: A packed NumPy representation of many ExclusionPoints, which can be checked against an
+  ExclusionIntervalArray in a single vectorized call.
+
 These classes provide methods for creating instances from serialized strings or dictionaries, checking
 if points are bounded by intervals, and constructing new intervals based on dynamic exclusion tolerances.
 """
 
 import ast
 import uuid
+from copy import deepcopy
+from dataclasses import dataclass
+from operator import attrgetter
 from typing import Union, Dict, Tuple, Any, List
-from pydantic import BaseModel
+
+import numpy as np
+from pydantic import BaseModel, VERSION as PYDANTIC_VERSION
+
+
+NEG_INF = float('-inf')
+POS_INF = float('inf')
 
 
 def convert_min_bounds(min_bound: Union[float, None]) -> float:
     """
     Convert the minimum bound value to a float.
 
-    If `min_bound` is None, returns the smallest negative finite float value
-    representable by the system (i.e. -sys.float_info.max).
+    If `min_bound` is None, returns negative infinity (NEG_INF), which is below every bound.
     Otherwise, returns `min_bound` as a float.
 
     Parameters:
@@ -41,7 +55,7 @@ def convert_min_bounds(min_bound: Union[float, None]) -> float:
         float: The minimum bound value as a float.
     """
     if min_bound is None:
-        return float('-inf')
+        return NEG_INF
     return min_bound
 
 
@@ -49,8 +63,7 @@ def convert_max_bounds(max_bound: Union[float, None]) -> float:
     """
     Convert the maximum bound value to a float.
 
-    If `max_bound` is None, returns the largest positive finite float value
-    representable by the system (i.e. sys.float_info.max).
+    If `max_bound` is None, returns positive infinity (POS_INF), which is above every bound.
     Otherwise, returns `max_bound` as a float.
 
     Parameters:
@@ -60,10 +73,21 @@ def convert_max_bounds(max_bound: Union[float, None]) -> float:
         float: The maximum bound value as a float.
     """
     if max_bound is None:
-        return float('inf')
+        return POS_INF
     return max_bound
 
 
+BOUND_FIELDS = ('min_mass', 'max_mass', 'min_rt', 'max_rt', 'min_ook0', 'max_ook0', 'min_intensity', 'max_intensity')
+INTERVAL_FIELDS = ('interval_id', 'charge') + BOUND_FIELDS + ('exclusion', 'data', 'interval_uuid')
+
+# pydantic 1 validates in Python, so skipping validation (construct) is ~4x faster for trusted values. pydantic 2
+# validates in Rust, which is faster than its model_construct.
+_SKIP_VALIDATION = PYDANTIC_VERSION.startswith('1.')
+
+# range of the compact charge column of ExclusionIntervalArray
+_INT8_INFO = np.iinfo(np.int8)
+
+
 class ExclusionInterval(BaseModel):
     """
     ExclusionInterval represents an interval in a multidimensional space defined by several properties.
@@ -85,6 +109,31 @@ class ExclusionInterval(BaseModel):
     data: Union[Any, None] = None
     interval_uuid: Union[str, None] = None
 
+    # cache for the bounds property (not a model field, so it is never serialized)
+    __slots__ = ('_bounds',)
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name in BOUND_FIELDS:
+            object.__setattr__(self, '_bounds', None)
+
+    @property
+    def bounds(self) -> Tuple[float, ...]:
+        """
+        The bounds of the ExclusionInterval, ordered as BOUND_FIELDS, with None lower bounds replaced by -inf
+        and None upper bounds replaced by inf. The tuple is cached until one of the bounds is reassigned.
+
+        :return: A tuple containing the eight bounds of the interval.
+        """
+        bounds = getattr(self, '_bounds', None)
+        if bounds is None:
+            bounds = (convert_min_bounds(self.min_mass), convert_max_bounds(self.max_mass),
+                      convert_min_bounds(self.min_rt), convert_max_bounds(self.max_rt),
+                      convert_min_bounds(self.min_ook0), convert_max_bounds(self.max_ook0),
+                      convert_min_bounds(self.min_intensity), convert_max_bounds(self.max_intensity))
+            object.__setattr__(self, '_bounds', bounds)
+        return bounds
+
     def generate_uuid(self) -> None:
         """
         Generates and assigns a UUID for the ExclusionInterval.
@@ -92,30 +141,29 @@ class ExclusionInterval(BaseModel):
         self.interval_uuid = str(uuid.uuid4())
 
     def __eq__(self, other):
-        if isinstance(other, ExclusionInterval):
+        if not isinstance(other, ExclusionInterval):
+            return False
+        if self is other:
+            return True
 
-            # UUID will be checked if both intervals contain valid UUID, else this will be skipped
-            uuid_flags = [self.interval_uuid is not None, other.interval_uuid is not None]
-            if all(uuid_flags):
-                uuid_comp = self.interval_uuid == other.interval_uuid
-            else:
-                uuid_comp = True
-
-            return (
-                self.charge == other.charge and
-                self.min_mass == other.min_mass and
-                self.max_mass == other.max_mass and
-                self.min_rt == other.min_rt and
-                self.max_rt == other.max_rt and
-                self.min_ook0 == other.min_ook0 and
-                self.max_ook0 == other.max_ook0 and
-                self.min_intensity == other.min_intensity and
-                self.max_intensity == other.max_intensity and
-                self.exclusion == other.exclusion and
-                self.data == self.data and
-                uuid_comp
-            )
-        return False
+        # UUID will be checked if both intervals contain valid UUID, else this will be skipped
+        if self.interval_uuid is not None and other.interval_uuid is not None and \
+                self.interval_uuid != other.interval_uuid:
+            return False
+
+        # the bounds are compared first, as they are the most likely to differ
+        return (
+            self.min_mass == other.min_mass and
+            self.max_mass == other.max_mass and
+            self.min_rt == other.min_rt and
+            self.max_rt == other.max_rt and
+            self.min_ook0 == other.min_ook0 and
+            self.max_ook0 == other.max_ook0 and
+            self.min_intensity == other.min_intensity and
+            self.max_intensity == other.max_intensity and
+            self.charge == other.charge and
+            self.exclusion == other.exclusion
+        )
 
     def is_enveloped_by(self, other: 'ExclusionInterval') -> bool:
         """
@@ -127,23 +175,14 @@ class ExclusionInterval(BaseModel):
         if other.charge is not None and self.charge is not None and self.charge != other.charge:
             return False
 
-        if convert_min_bounds(self.min_mass) < convert_min_bounds(other.min_mass) or \
-                convert_max_bounds(self.max_mass) > convert_max_bounds(other.max_mass):
-            return False
-
-        if convert_min_bounds(self.min_rt) < convert_min_bounds(other.min_rt) or \
-                convert_max_bounds(self.max_rt) > convert_max_bounds(other.max_rt):
-            return False
-
-        if convert_min_bounds(self.min_ook0) < convert_min_bounds(other.min_ook0) or \
-                convert_max_bounds(self.max_ook0) > convert_max_bounds(other.max_ook0):
-            return False
-
-        if convert_min_bounds(self.min_intensity) < convert_min_bounds(other.min_intensity) or \
-                convert_max_bounds(self.max_intensity) > convert_max_bounds(other.max_intensity):
-            return False
+        min_mass, max_mass, min_rt, max_rt, min_ook0, max_ook0, min_intensity, max_intensity = self.bounds
+        (other_min_mass, other_max_mass, other_min_rt, other_max_rt,
+         other_min_ook0, other_max_ook0, other_min_intensity, other_max_intensity) = other.bounds
 
-        return True
+        return other_min_mass <= min_mass and max_mass <= other_max_mass and \
+            other_min_rt <= min_rt and max_rt <= other_max_rt and \
+            other_min_ook0 <= min_ook0 and max_ook0 <= other_max_ook0 and \
+            other_min_intensity <= min_intensity and max_intensity <= other_max_intensity
 
     def to_dict_rounded(self) -> Dict[str, Union[str, int, float]]:
         """
@@ -206,6 +245,33 @@ class ExclusionInterval(BaseModel):
         exclusion_interval = ExclusionInterval(**res)
         return exclusion_interval
 
+    @staticmethod
+    def from_tuple(values: Tuple) -> 'ExclusionInterval':
+        """
+        Create an ExclusionInterval instance from a tuple of values ordered as INTERVAL_FIELDS. Trailing fields
+        with defaults (exclusion, data, interval_uuid) may be omitted. Intended for bulk construction from trusted
+        values (e.g. intervals read back from storage): depending on the pydantic version, the values may not be
+        validated.
+
+        :param values: A tuple containing the ExclusionInterval properties.
+        :return: An ExclusionInterval instance.
+        """
+        if _SKIP_VALIDATION:
+            return ExclusionInterval.construct(**dict(zip(INTERVAL_FIELDS, values)))
+        return ExclusionInterval(**dict(zip(INTERVAL_FIELDS, values)))
+
+    def __deepcopy__(self, memo: Dict = None) -> 'ExclusionInterval':
+        """
+        Copy the ExclusionInterval field by field. Only data can hold a mutable object, so it is the only field that
+        is deep copied, which is considerably cheaper than the generic model deepcopy.
+
+        :param memo: The deepcopy memo dictionary.
+        :return: A new ExclusionInterval instance equal to this one.
+        """
+        values = [getattr(self, field) for field in INTERVAL_FIELDS]
+        values[INTERVAL_FIELDS.index('data')] = deepcopy(self.data, memo)
+        return ExclusionInterval.from_tuple(values)
+
     def contains_point(self, point: 'ExclusionPoint') -> bool:
         """
         Check if the given ExclusionPoint is contained within the current ExclusionInterval.
@@ -216,13 +282,15 @@ class ExclusionInterval(BaseModel):
         return point.is_bounded_by(interval=self)
 
 
-class ExclusionPoint(BaseModel):
+class ExclusionPoint(BaseModel, frozen=True):
     """
     Represents a point in the excluded multidimensional space. Each dimension corresponds to a property
     such as charge, mass, retention time (rt), ook0, and intensity. None values for a property will be
     ignored during comparisons with ExclusionInterval objects. ExclusionPoint provides methods to check
     whether the point is bounded by a given ExclusionInterval and to create an instance from a serialized
     string or dictionary.
+
+    ExclusionPoints are immutable and hashable, so they can be used as dictionary keys or set members.
     """
     charge: Union[int, None]
     mass: Union[float, None]
@@ -230,6 +298,29 @@ class ExclusionPoint(BaseModel):
     ook0: Union[float, None]
     intensity: Union[float, None]
 
+    # cache for __hash__ (not a model field, so it is never serialized)
+    __slots__ = ('_hash',)
+
+    def __hash__(self) -> int:
+        # the point is immutable, so the hash of its values is computed once
+        point_hash = getattr(self, '_hash', None)
+        if point_hash is None:
+            point_hash = hash((self.charge, self.mass, self.rt, self.ook0, self.intensity))
+            object.__setattr__(self, '_hash', point_hash)
+        return point_hash
+
+    def __eq__(self, other):
+        if not isinstance(other, ExclusionPoint):
+            return NotImplemented
+        return self is other or (
+            hash(self) == hash(other) and
+            self.charge == other.charge and
+            self.mass == other.mass and
+            self.rt == other.rt and
+            self.ook0 == other.ook0 and
+            self.intensity == other.intensity
+        )
+
     def is_bounded_by(self, interval: ExclusionInterval) -> bool:
         """
         Check if the ExclusionPoint is within the given ExclusionInterval.
@@ -240,44 +331,31 @@ class ExclusionPoint(BaseModel):
         if self.charge is not None and interval.charge is not None and self.charge != interval.charge:
             return False
 
-        if self.rt is not None and (self.rt < convert_min_bounds(interval.min_rt) or
-                                    self.rt >= convert_max_bounds(interval.max_rt)):
-            return False
-
-        if self.ook0 is not None and (self.ook0 < convert_min_bounds(interval.min_ook0) or
-                                      self.ook0 >= convert_max_bounds(interval.max_ook0)):
-            return False
-
-        if self.intensity is not None and (self.intensity < convert_min_bounds(interval.min_intensity) or
-                                           self.intensity >= convert_max_bounds(interval.max_intensity)):
-            return False
+        min_mass, max_mass, min_rt, max_rt, min_ook0, max_ook0, min_intensity, max_intensity = interval.bounds
+        mass, rt, ook0, intensity = self.mass, self.rt, self.ook0, self.intensity
 
-        if self.mass is not None and (self.mass < convert_min_bounds(interval.min_mass) or
-                                      self.mass >= convert_max_bounds(interval.max_mass)):
-            return False
-
-        return True
+        return (rt is None or min_rt <= rt < max_rt) and \
+            (ook0 is None or min_ook0 <= ook0 < max_ook0) and \
+            (intensity is None or min_intensity <= intensity < max_intensity) and \
+            (mass is None or min_mass <= mass < max_mass)
 
     def is_bounded_by_quick(self, interval: ExclusionInterval) -> bool:
         """
-        Check if the ExclusionPoint is within the given ExclusionInterval.
+        Check if the ExclusionPoint is within the given ExclusionInterval, ignoring the mass dimension. Used when
+        the mass dimension has already been checked (e.g. by an interval tree lookup).
 
         :param interval: An ExclusionInterval instance to check against.
         :return: True if the point is within the interval, False otherwise.
         """
-
         if self.charge is not None and interval.charge is not None and self.charge != interval.charge:
             return False
 
-        for attribute in ['rt', 'ook0', 'intensity']:
-            value = getattr(self, attribute)
-            if value is not None:
-                min_bound = convert_min_bounds(getattr(interval, 'min_' + attribute))
-                max_bound = convert_max_bounds(getattr(interval, 'max_' + attribute))
-                if value < min_bound or value >= max_bound:
-                    return False
+        _, _, min_rt, max_rt, min_ook0, max_ook0, min_intensity, max_intensity = interval.bounds
+        rt, ook0, intensity = self.rt, self.ook0, self.intensity
 
-        return True
+        return (rt is None or min_rt <= rt < max_rt) and \
+            (ook0 is None or min_ook0 <= ook0 < max_ook0) and \
+            (intensity is None or min_intensity <= intensity < max_intensity)
 
     @staticmethod
     def from_str(serialized_point: str) -> 'ExclusionPoint':
@@ -300,6 +378,23 @@ class ExclusionPoint(BaseModel):
         """
         return ExclusionPoint(**res)
 
+    def __copy__(self) -> 'ExclusionPoint':
+        """
+        ExclusionPoints are immutable, so a copy is the point itself.
+
+        :return: This ExclusionPoint.
+        """
+        return self
+
+    def __deepcopy__(self, memo: Dict = None) -> 'ExclusionPoint':
+        """
+        ExclusionPoints are immutable and only hold numbers or None, so a deep copy is the point itself.
+
+        :param memo: The deepcopy memo dictionary.
+        :return: This ExclusionPoint.
+        """
+        return self
+
 
 class ExclusionPointBatchMessage(BaseModel):
     """
@@ -448,3 +543,245 @@ class DynamicExclusionTolerance(BaseModel):
         return ExclusionInterval(interval_id=interval_id, charge=charge, min_mass=min_mass,
                                  max_mass=max_mass, min_rt=min_rt, max_rt=max_rt, min_ook0=min_ook0,
                                  max_ook0=max_ook0, min_intensity=min_intensity, max_intensity=max_intensity)
+
+
+@dataclass
+class ExclusionIntervalArray:
+    """
+    Represents a list of ExclusionIntervals as parallel NumPy arrays (struct-of-arrays), one array per property.
+    None bounds are stored as -inf (lower bounds) or inf (upper bounds), and None charges are tracked by the
+    has_charge mask, so that bulk comparisons can be evaluated with vectorized boolean mask arithmetic instead of
+    per-interval attribute access. Charges are stored as int8, or as int64 if any charge is outside the int8 range.
+    """
+    interval_id: np.ndarray
+    charge: np.ndarray
+    has_charge: np.ndarray
+    min_mass: np.ndarray
+    max_mass: np.ndarray
+    min_rt: np.ndarray
+    max_rt: np.ndarray
+    min_ook0: np.ndarray
+    max_ook0: np.ndarray
+    min_intensity: np.ndarray
+    max_intensity: np.ndarray
+    exclusion: np.ndarray
+
+    @staticmethod
+    def from_list(intervals: List[ExclusionInterval]) -> 'ExclusionIntervalArray':
+        """
+        Create an ExclusionIntervalArray from a list of ExclusionIntervals.
+
+        :param intervals: A list of ExclusionInterval instances.
+        :return: An ExclusionIntervalArray instance.
+        """
+        interval_id = np.empty(len(intervals), dtype=object)
+        interval_id[:] = [interval.interval_id for interval in intervals]
+
+        # One pass over the cached bounds tuples, which already have None replaced by -inf/inf
+        bounds = np.array([interval.bounds for interval in intervals], dtype=np.float64).reshape(-1, len(BOUND_FIELDS))
+
+        charge = np.array([interval.charge or 0 for interval in intervals], dtype=np.int64)
+        if len(charge) == 0 or (charge.min() >= _INT8_INFO.min and charge.max() <= _INT8_INFO.max):
+            charge = charge.astype(np.int8)
+
+        return ExclusionIntervalArray(
+            interval_id=interval_id,
+            charge=charge,
+            has_charge=np.array([interval.charge is not None for interval in intervals], dtype=np.bool_),
+            min_mass=bounds[:, 0],
+            max_mass=bounds[:, 1],
+            min_rt=bounds[:, 2],
+            max_rt=bounds[:, 3],
+            min_ook0=bounds[:, 4],
+            max_ook0=bounds[:, 5],
+            min_intensity=bounds[:, 6],
+            max_intensity=bounds[:, 7],
+            exclusion=np.array([interval.exclusion for interval in intervals], dtype=np.bool_))
+
+    def __len__(self) -> int:
+        return len(self.interval_id)
+
+    def is_enveloped_by(self, other: ExclusionInterval) -> np.ndarray:
+        """
+        Check which intervals of the array are enveloped by the given ExclusionInterval. Equivalent to calling
+        ExclusionInterval.is_enveloped_by for every interval of the array.
+
+        :param other: An ExclusionInterval instance to compare with.
+        :return: A boolean array, True where the interval is enveloped by the other interval.
+        """
+        (other_min_mass, other_max_mass, other_min_rt, other_max_rt,
+         other_min_ook0, other_max_ook0, other_min_intensity, other_max_intensity) = other.bounds
+
+        # Comparisons against a None (infinite) bound of the other interval are always true and are skipped. The
+        # remaining ones are accumulated in place, so that at most two boolean buffers are allocated.
+        mask = np.ones(len(self), dtype=np.bool_)
+        tmp = np.empty_like(mask)
+        for column, bound in ((self.min_mass, other_min_mass), (self.min_rt, other_min_rt),
+                              (self.min_ook0, other_min_ook0), (self.min_intensity, other_min_intensity)):
+            if bound != NEG_INF:
+                np.greater_equal(column, bound, out=tmp)
+                mask &= tmp
+        for column, bound in ((self.max_mass, other_max_mass), (self.max_rt, other_max_rt),
+                              (self.max_ook0, other_max_ook0), (self.max_intensity, other_max_intensity)):
+            if bound != POS_INF:
+                np.less_equal(column, bound, out=tmp)
+                mask &= tmp
+
+        if other.charge is not None:
+            mask &= ~self.has_charge | (self.charge == other.charge)
+
+        return mask
+
+    def contains_point(self, point: ExclusionPoint) -> np.ndarray:
+        """
+        Check which intervals of the array contain the given ExclusionPoint. Equivalent to calling
+        ExclusionPoint.is_bounded_by for every interval of the array.
+
+        :param point: An ExclusionPoint instance to check.
+        :return: A boolean array, True where the interval contains the point.
+        """
+        # None values of the point are skipped. The first comparison initialises the mask, and the remaining ones
+        # are written into a single preallocated buffer and accumulated in place, so no temporary array is allocated
+        # per comparison.
+        mask, tmp = None, None
+        for value, min_column, max_column in ((point.mass, self.min_mass, self.max_mass),
+                                              (point.rt, self.min_rt, self.max_rt),
+                                              (point.ook0, self.min_ook0, self.max_ook0),
+                                              (point.intensity, self.min_intensity, self.max_intensity)):
+            if value is None:
+                continue
+            if mask is None:
+                mask = min_column <= value
+                tmp = np.empty_like(mask)
+            else:
+                np.less_equal(min_column, value, out=tmp)
+                mask &= tmp
+            np.greater(max_column, value, out=tmp)
+            mask &= tmp
+
+        if mask is None:
+            mask = np.ones(len(self), dtype=np.bool_)
+            tmp = np.empty_like(mask)
+
+        if point.charge is not None:
+            np.equal(self.charge, point.charge, out=tmp)
+            tmp |= ~self.has_charge
+            mask &= tmp
+
+        return mask
+
+
+POINT_FIELDS = ('charge', 'mass', 'rt', 'ook0', 'intensity')
+_GET_POINT_FIELDS = attrgetter(*POINT_FIELDS)
+
+
+@dataclass
+class ExclusionPointBatch:
+    """
+    Represents a list of ExclusionPoints as a packed (N, 5) float64 array, with columns ordered as POINT_FIELDS.
+    None values are stored as 0.0 and flagged in a bit-packed uint8 validity mask, in which bit i is set when column
+    i of the point is not None.
+    """
+    values: np.ndarray
+    mask: np.ndarray
+
+    @staticmethod
+    def from_points(points: List[ExclusionPoint]) -> 'ExclusionPointBatch':
+        """
+        Create an ExclusionPointBatch from a list of ExclusionPoints.
+
+        :param points: A list of ExclusionPoint instances.
+        :return: An ExclusionPointBatch instance.
+        """
+        fields = np.array([_GET_POINT_FIELDS(point) for point in points], dtype=object).reshape(-1, len(POINT_FIELDS))
+        valid = fields != None  # noqa: E711, elementwise comparison
+        values = np.where(valid, fields, 0.0).astype(np.float64)
+        mask = (valid << np.arange(len(POINT_FIELDS), dtype=np.uint8)).sum(axis=1, dtype=np.uint8)
+        return ExclusionPointBatch(values=values, mask=mask)
+
+    @staticmethod
+    def from_array(values: np.ndarray) -> 'ExclusionPointBatch':
+        """
+        Create an ExclusionPointBatch from an (N, 5) array with columns ordered as POINT_FIELDS, in which NaN
+        stands for None.
+
+        :param values: An array-like of shape (N, 5).
+        :return: An ExclusionPointBatch instance.
+        """
+        values = np.array(values, dtype=np.float64).reshape(-1, len(POINT_FIELDS))
+        valid = ~np.isnan(values)
+        mask = (valid << np.arange(len(POINT_FIELDS), dtype=np.uint8)).sum(axis=1, dtype=np.uint8)
+        values[~valid] = 0.0
+        return ExclusionPointBatch(values=values, mask=mask)
+
+    def __len__(self) -> int:
+        return len(self.mask)
+
+    def is_valid(self, field: str) -> np.ndarray:
+        """
+        Get which points of the batch have a value (i.e. are not None) for the given field.
+
+        :param field: One of POINT_FIELDS.
+        :return: A boolean array, True where the point's field is not None.
+        """
+        return (self.mask & (1 << POINT_FIELDS.index(field))) != 0
+
+    def is_bounded_by(self, intervals: ExclusionIntervalArray) -> np.ndarray:
+        """
+        Check every point of the batch against every interval of the given ExclusionIntervalArray. Equivalent to
+        calling ExclusionPoint.is_bounded_by for every (point, interval) pair.
+
+        :param intervals: An ExclusionIntervalArray instance to check against.
+        :return: A boolean array of shape (len(points), len(intervals)), True where the point is within the interval.
+        """
+        result = np.ones((len(self), len(intervals)), dtype=np.bool_)
+
+        # The charge and mass (hot) columns are compared for every pair, and reject most of them.
+        charge = self.values[:, 0, None]
+        charge_valid = self.is_valid('charge')[:, None]
+        result &= ~charge_valid | ~intervals.has_charge | (charge == intervals.charge)
+
+        mass = self.values[:, 1, None]
+        mass_valid = self.is_valid('mass')[:, None]
+        result &= ~mass_valid | ((intervals.min_mass <= mass) & (mass < intervals.max_mass))
+
+        # The remaining (cold) columns are only gathered and compared for the surviving pairs.
+        rows, cols = np.nonzero(result)
+        keep = np.ones(len(rows), dtype=np.bool_)
+        for j, (min_bound, max_bound) in enumerate(((intervals.min_rt, intervals.max_rt),
+                                                    (intervals.min_ook0, intervals.max_ook0),
+                                                    (intervals.min_intensity, intervals.max_intensity)), start=2):
+            value = self.values[rows, j]
+            valid = (self.mask[rows] & (1 << j)) != 0
+            keep &= ~valid | ((min_bound[cols] <= value) & (value < max_bound[cols]))
+        result[rows[~keep], cols[~keep]] = False
+
+        return result
+
+    def is_bounded_by_pairs(self, intervals: ExclusionIntervalArray, point_index: np.ndarray,
+                            interval_index: np.ndarray) -> np.ndarray:
+        """
+        Check selected (point, interval) pairs, given as two index arrays of equal length. Equivalent to calling
+        ExclusionPoint.is_bounded_by for each pair.
+
+        :param intervals: An ExclusionIntervalArray instance to check against.
+        :param point_index: The indices of the points of the batch.
+        :param interval_index: The indices of the intervals of the array.
+        :return: A boolean array, True where the point of the pair is within the interval of the pair.
+        """
+        mask = self.mask[point_index]
+        values = self.values[point_index]
+
+        charge_valid = (mask & 1) != 0
+        charge_match = values[:, 0] == intervals.charge[interval_index]
+        result = ~charge_valid | ~intervals.has_charge[interval_index] | charge_match
+
+        for j, (min_bound, max_bound) in enumerate(((intervals.min_mass, intervals.max_mass),
+                                                    (intervals.min_rt, intervals.max_rt),
+                                                    (intervals.min_ook0, intervals.max_ook0),
+                                                    (intervals.min_intensity, intervals.max_intensity)), start=1):
+            valid = (mask & (1 << j)) != 0
+            value = values[:, j]
+            result &= ~valid | ((min_bound[interval_index] <= value) & (value < max_bound[interval_index]))
+
+        return result
@@ -5,13 +5,29 @@ by various methods. This module also provides utility functions for converting
 ExclusionIntervals to mass intervals and querying the MassIntervalTree.
 """
 
+import json
 import pickle
+import sys
 from dataclasses import dataclass, field
 from enum import IntEnum
-from typing import Dict, Any, List, Generator
+from operator import attrgetter
+from typing import Dict, Any, List, Generator, Tuple, Union, BinaryIO, Iterable
+
+import numpy as np
 from intervaltree import IntervalTree, Interval
 
-from .components import ExclusionInterval, ExclusionPoint, convert_min_bounds, convert_max_bounds
+from .components import ExclusionInterval, ExclusionPoint, ExclusionIntervalArray, ExclusionPointBatch, \
+    convert_min_bounds, convert_max_bounds, BOUND_FIELDS
+
+
+# upper limit on the (point, interval) candidate pairs checked at once by MassIntervalTree.are_excluded
+MAX_CANDIDATE_PAIRS = 1 << 20
+
+# upper limit on the number of results remembered by MassIntervalTree.is_excluded_cached
+EXCLUDED_CACHE_SIZE = 1 << 14
+
+# raw (not inf-converted) bounds of an ExclusionInterval, ordered as BOUND_FIELDS
+_GET_BOUNDS = attrgetter(*BOUND_FIELDS)
 
 
 class IntervalStatus(IntEnum):
@@ -21,6 +37,11 @@ class IntervalStatus(IntEnum):
     EXCLUDED_INCLUDED = 2
 
 
+# IntervalStatus of MassIntervalTree.point_status, indexed by its excluded (bit 0) / included (bit 1) flags
+_STATUS_BY_FLAGS = (IntervalStatus.NO_INTERVALS_FOUND, IntervalStatus.EXCLUDED, IntervalStatus.INCLUDED,
+                    IntervalStatus.EXCLUDED_INCLUDED)
+
+
 def get_mass_interval(ex_interval: ExclusionInterval):
     """
     Convert an ExclusionInterval into a IntervalTree interval based on the exclusion intervals mass bounds.
@@ -36,20 +57,54 @@ def get_mass_interval(ex_interval: ExclusionInterval):
                     ex_interval)
 
 
+def _intern_id(ex_interval: ExclusionInterval) -> None:
+    """
+    Replace the interval_id of an ExclusionInterval with its interned string, so that the many intervals sharing
+    an id (e.g. one peptide) also share a single string object. Ids that are not exactly str (e.g. set through
+    construct without validation) are left unchanged.
+
+    Args:
+        ex_interval (ExclusionInterval): The exclusion interval whose id is interned.
+    """
+    if type(ex_interval.interval_id) is not str:  # pylint: disable=unidiomatic-typecheck
+        return
+    interval_id = sys.intern(ex_interval.interval_id)
+    if interval_id is not ex_interval.interval_id:
+        ex_interval.interval_id = interval_id
+
+
 @dataclass
 class MassIntervalTree:
     """
     A data structure for managing ExclusionIntervals.
 
+    Stored intervals are indexed by their mass bounds and copied into the snapshot used by the vectorized queries,
+    so they must not be changed in place. To change a stored interval, remove it, change it and add it again.
+
     Attributes:
         interval_tree (IntervalTree): An interval tree for managing mass intervals.
         id_dict (Dict[str, set]): A dictionary for managing intervals by their ID.
+        uuid_dict (Dict[str, ExclusionInterval]): A dictionary for managing intervals by their UUID.
     """
 
     interval_tree: IntervalTree = field(default_factory=IntervalTree)
     id_dict: Dict[str, set] = field(default_factory=dict)
     uuid_dict: Dict[str, ExclusionInterval] = field(default_factory=dict)
 
+    # column-oriented copy of the stored intervals, built on demand and dropped whenever the tree changes
+    _snapshot: Tuple[List[Interval], ExclusionIntervalArray] = field(default=None, init=False, repr=False,
+                                                                     compare=False)
+    # results of is_excluded_cached, dropped whenever the tree changes
+    _excluded_cache: Dict[ExclusionPoint, bool] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def _changed(self) -> None:
+        """
+        Drop the data derived from the stored intervals (the snapshot and cached query results). Must be called
+        whenever the stored intervals change.
+        """
+        self._snapshot = None
+        self._excluded_cache.clear()
+
     def add(self, ex_interval: ExclusionInterval):
         """
            Add an ExclusionInterval to the tree. A Unique UUID will be generated for each valid exclusion interval.
@@ -64,12 +119,63 @@ class MassIntervalTree:
         if ex_interval.interval_id is None:
             raise ValueError('Cannot add an interval with id = None')
 
+        # the same instance is already stored (one dict lookup); generating a new UUID for it would leave the
+        # old UUID behind in uuid_dict
+        if self.uuid_dict.get(ex_interval.interval_uuid) is ex_interval:
+            return
+
         ex_interval.generate_uuid()
+        _intern_id(ex_interval)
 
         mass_interval = get_mass_interval(ex_interval)
         self.interval_tree.add(mass_interval)
         self.id_dict.setdefault(ex_interval.interval_id, set()).add(mass_interval)
         self.uuid_dict[ex_interval.interval_uuid] = ex_interval
+        self._changed()
+
+    def add_many(self, ex_intervals: Iterable[ExclusionInterval]):
+        """
+           Add several ExclusionIntervals to the tree. Equivalent to calling add for each interval, but when the
+           tree is empty it is built in bulk, which is considerably faster than inserting the intervals one by one.
+
+           Args:
+               ex_intervals (Iterable[ExclusionInterval]): The exclusion intervals to be added.
+
+           Raises:
+               Exception: If the interval_id of any interval is None, or if the mass bounds of any interval are
+                equal (a null interval, which the interval tree rejects). No interval is added in either case.
+        """
+        new_intervals = []
+        seen = set()
+        for ex_interval in ex_intervals:
+            # skips instances that are already stored, and repeats within ex_intervals
+            if self.uuid_dict.get(ex_interval.interval_uuid) is ex_interval or id(ex_interval) in seen:
+                continue
+            seen.add(id(ex_interval))
+            new_intervals.append(ex_interval)
+
+        if any(ex_interval.interval_id is None for ex_interval in new_intervals):
+            raise ValueError('Cannot add an interval with id = None')
+        mass_intervals = [get_mass_interval(ex_interval) for ex_interval in new_intervals]
+        for mass_interval in mass_intervals:
+            if mass_interval.is_null():
+                raise ValueError(f'Cannot add an interval with a null mass range: {mass_interval.data}')
+
+        for ex_interval in new_intervals:
+            ex_interval.generate_uuid()
+            _intern_id(ex_interval)
+
+        # the tree is built before the lookup tables are filled, so that a failure leaves the tree unchanged
+        if len(self.interval_tree) == 0:
+            self.interval_tree = IntervalTree(mass_intervals)
+        else:
+            self.interval_tree.update(mass_intervals)
+
+        for mass_interval in mass_intervals:
+            ex_interval = mass_interval.data
+            self.id_dict.setdefault(ex_interval.interval_id, set()).add(mass_interval)
+            self.uuid_dict[ex_interval.interval_uuid] = ex_interval
+        self._changed()
 
     def remove(self, ex_interval: ExclusionInterval) -> List[ExclusionInterval]:
         """
@@ -98,6 +204,7 @@ class MassIntervalTree:
         for interval in intervals:
             self.uuid_dict.pop(interval.interval_uuid)
 
+        self._changed()
         return intervals
 
     def remove_by_uuid(self, interval_uuid: str) -> ExclusionInterval:
@@ -117,6 +224,7 @@ class MassIntervalTree:
         if len(self.id_dict[interval.interval_id]) == 0:
             self.id_dict.pop(interval.interval_id)
         self.uuid_dict.pop(interval.interval_uuid)
+        self._changed()
 
         return interval
 
@@ -151,6 +259,11 @@ class MassIntervalTree:
             List[Interval]: A list of Interval objects that are enveloped by the given ExclusionInterval based on their
              mass bounds.
         """
+        if ex_interval.min_mass is None and ex_interval.max_mass is None:
+            # an unbounded mass range envelops the whole interval tree, so test every interval at once
+            mass_intervals, interval_array = self.get_snapshot()
+            return [mass_intervals[i] for i in np.flatnonzero(interval_array.is_enveloped_by(ex_interval))]
+
         intervals = self.interval_tree.envelop(get_mass_interval(ex_interval))
         intervals = [i for i in intervals if i.data.is_enveloped_by(ex_interval)]
         return intervals
@@ -184,6 +297,71 @@ class MassIntervalTree:
                 return True
         return False
 
+    def is_excluded_cached(self, point: ExclusionPoint) -> bool:
+        """
+            Check if a point is excluded by any of the exclusion intervals, like is_excluded, but remember the result
+            for the point until an interval is added or removed. Useful when the same points are checked repeatedly
+            (e.g. across scans). Points are matched exactly; at most EXCLUDED_CACHE_SIZE results are kept. Stored
+            intervals must only be changed by removing and re-adding them, otherwise cached results go stale.
+
+            Args:
+                point (ExclusionPoint): The point to be checked.
+
+            Returns:
+                bool: True if the point is excluded by any of the intervals, False otherwise.
+        """
+        excluded = self._excluded_cache.get(point)
+        if excluded is None:
+            if len(self._excluded_cache) >= EXCLUDED_CACHE_SIZE:
+                self._excluded_cache.clear()
+            excluded = self._excluded_cache[point] = self.is_excluded(point)
+        return excluded
+
+    def are_excluded(self, points: Union[List[ExclusionPoint], ExclusionPointBatch]) -> np.ndarray:
+        """
+            Check which points are excluded by any of the exclusion intervals. Gives the same result as calling
+            is_excluded for each point, but checks the whole batch with vectorized operations over the snapshot
+            (see get_snapshot).
+
+            Args:
+                points (Union[List[ExclusionPoint], ExclusionPointBatch]): The points to be checked. Points that
+                 are already packed (e.g. with ExclusionPointBatch.from_array) are used as they are.
+
+            Returns:
+                np.ndarray: A boolean array, True where the point is excluded by any of the intervals.
+        """
+        batch = points if isinstance(points, ExclusionPointBatch) else ExclusionPointBatch.from_points(points)
+        excluded = np.zeros(len(batch), dtype=np.bool_)
+        _, interval_array = self.get_snapshot()
+        if len(batch) == 0 or len(interval_array) == 0:
+            return excluded
+
+        # The snapshot is sorted by min_mass, so the intervals that can contain a mass lie between the first one whose
+        # running max of max_mass exceeds the mass and the last one whose min_mass is below or equal to it.
+        mass = batch.values[:, 1]
+        has_mass = batch.is_valid('mass')
+        starts = np.where(has_mass, np.searchsorted(np.maximum.accumulate(interval_array.max_mass), mass, 'right'), 0)
+        stops = np.where(has_mass, np.searchsorted(interval_array.min_mass, mass, 'right'), len(interval_array))
+        counts = np.maximum(stops - starts, 0)
+        ends = np.cumsum(counts)
+
+        begin = 0
+        while begin < len(batch):
+            offset = ends[begin - 1] if begin > 0 else 0
+            end = max(int(np.searchsorted(ends, offset + MAX_CANDIDATE_PAIRS, 'right')), begin + 1)
+
+            chunk_counts = counts[begin:end]
+            point_index = np.repeat(np.arange(begin, end), chunk_counts)
+            pair_offsets = np.arange(len(point_index)) - np.repeat(np.cumsum(chunk_counts) - chunk_counts, chunk_counts)
+            interval_index = starts[point_index] + pair_offsets
+
+            hits = batch.is_bounded_by_pairs(interval_array, point_index, interval_index)
+            hits &= interval_array.exclusion[interval_index]
+            excluded[point_index[hits]] = True
+            begin = end
+
+        return excluded
+
     def is_included(self, point: ExclusionPoint) -> bool:
         """
             Check if a point is included by any of the exclusion intervals.
@@ -215,19 +393,14 @@ class MassIntervalTree:
             IntervalStatus: The status of the exclusion point.
         """
 
-        intervals = list(self.query_by_point(point))
+        # bit 0 is set by an excluding interval and bit 1 by an including one; once both are set the result is known
+        flags = 0
+        for interval in self.query_by_point(point):
+            flags |= 1 if interval.exclusion else 2
+            if flags == 3:
+                break
 
-        if len(intervals) == 0:
-            return IntervalStatus.NO_INTERVALS_FOUND
-
-        exclusion_flags = [interval.exclusion for interval in intervals]
-
-        if all(exclusion_flags):
-            return IntervalStatus.EXCLUDED
-        if not any(exclusion_flags):
-            return IntervalStatus.INCLUDED
-
-        return IntervalStatus.EXCLUDED_INCLUDED
+        return _STATUS_BY_FLAGS[flags]
 
     def query_by_interval(self, ex_interval: ExclusionInterval) -> List[ExclusionInterval]:
         """
@@ -252,10 +425,17 @@ class MassIntervalTree:
                 List[ExclusionInterval]: A list of exclusion intervals that exclude the search criteria.
         """
         if point.mass is None:
-            intervals = list(self.interval_tree)
-        else:
-            intervals = self.interval_tree[point.mass]
-
+            # without a mass the interval tree cannot narrow the search, so scan every interval at once
+            mass_intervals, interval_array = self.get_snapshot()
+            return (mass_intervals[i].data for i in np.flatnonzero(interval_array.contains_point(point)))
+
+        intervals = self.interval_tree[point.mass]
+        if point.rt is None and point.ook0 is None and point.intensity is None:
+            # the interval tree has already checked the mass, so only the charge is left to compare
+            if point.charge is None:
+                return (interval.data for interval in intervals)
+            return (interval.data for interval in intervals
+                    if interval.data.charge is None or interval.data.charge == point.charge)
         return (interval.data for interval in intervals if point.is_bounded_by_quick(interval.data))
 
     def query_by_id(self, interval_id: Any) -> List[ExclusionInterval]:
@@ -270,29 +450,125 @@ class MassIntervalTree:
         """
         return [interval.data for interval in self._get_intervals_by_id(interval_id)]
 
-    def save(self, file_path: str):
+    def save(self, file_path: Union[str, BinaryIO]):
         """
-           Save the MassIntervalTree to a file.
+           Save the MassIntervalTree to a file. Paths ending in '.npz' are saved as NumPy arrays, one per
+           ExclusionInterval field, which requires the interval data to be JSON serializable. All other paths are
+           pickled. A binary file-like object (e.g. io.BytesIO) is pickled into directly.
 
            Args:
-               file_path (str): The path of the file to be saved.
+               file_path (Union[str, BinaryIO]): The path of the file to be saved, or a writable binary file object.
         """
+        if hasattr(file_path, 'write'):
+            pickle.dump(self.interval_tree, file_path, -1)
+            return
+
+        if str(file_path).endswith('.npz'):
+            self._save_npz(file_path)
+            return
+
         with open(file_path, "wb") as file:
             pickle.dump(self.interval_tree, file, -1)
 
-    def load(self, file_path: str) -> None:
+    def load(self, file_path: Union[str, BinaryIO]) -> None:
         """
-            Load the MassIntervalTree from a file.
+            Load the MassIntervalTree from a file written by save(). Pickled files can run arbitrary code when
+            loaded, so only load them from trusted sources. '.npz' files are loaded without unpickling.
 
             Args:
-                file_path (str): The path of the file to be loaded.
+                file_path (Union[str, BinaryIO]): The path of the file to be loaded, or a readable binary file
+                 object positioned at the start of the pickled data.
+        """
+        if hasattr(file_path, 'read'):
+            self.interval_tree = pickle.load(file_path)
+        elif str(file_path).endswith('.npz'):
+            self._load_npz(file_path)
+            return
+        else:
+            with open(file_path, "rb") as file:
+                self.interval_tree = pickle.load(file)
+        self.build_index()
+
+    def _save_npz(self, file_path: str) -> None:
+        """
+        Save the ExclusionIntervals as NumPy arrays, one per field. None bounds are stored as NaN, None charges
+        are tracked by the has_charge array and ids and UUIDs are stored UTF-8 encoded. The data array is only
+        written if an interval has data, as UTF-8 encoded JSON, so that no array needs to be pickled.
+
+        Args:
+            file_path (str): The path of the file to be saved.
+        """
+        intervals = list(self)
+        arrays = {
+            'interval_id': np.array([interval.interval_id.encode() for interval in intervals], dtype=bytes),
+            'charge': np.array([interval.charge or 0 for interval in intervals], dtype=np.int64),
+            'has_charge': np.array([interval.charge is not None for interval in intervals], dtype=np.bool_),
+            'exclusion': np.array([interval.exclusion for interval in intervals], dtype=np.bool_),
+            'interval_uuid': np.array([interval.interval_uuid.encode() for interval in intervals], dtype=bytes),
+        }
+        # None bounds become NaN when the attrgetter tuples are converted to float64
+        bounds = np.array([_GET_BOUNDS(interval) for interval in intervals], dtype=np.float64)
+        bounds = bounds.reshape(-1, len(BOUND_FIELDS))
+        for i, bound_field in enumerate(BOUND_FIELDS):
+            arrays[bound_field] = bounds[:, i]
+        if any(interval.data is not None for interval in intervals):
+            arrays['data'] = np.array([json.dumps(interval.data).encode() for interval in intervals], dtype=bytes)
+
+        np.savez(file_path, **arrays)
+
+    def _load_npz(self, file_path: str) -> None:
+        """
+        Load ExclusionIntervals saved by _save_npz, replacing the contents of the tree. Object arrays are rejected
+        (allow_pickle=False), so loading a file cannot run code from it.
+
+        Args:
+            file_path (str): The path of the file to be loaded.
+        """
+        with np.load(file_path, allow_pickle=False) as arrays:
+            interval_ids = [sys.intern(interval_id) for interval_id in np.char.decode(arrays['interval_id']).tolist()]
+            charges = [charge if has_charge else None
+                       for charge, has_charge in zip(arrays['charge'].tolist(), arrays['has_charge'].tolist())]
+            bounds = [[None if value != value else value for value in arrays[bound_field].tolist()]
+                      for bound_field in BOUND_FIELDS]
+            exclusions = arrays['exclusion'].tolist()
+            if 'data' in arrays.files:
+                data = [json.loads(value) for value in np.char.decode(arrays['data']).tolist()]
+            else:
+                data = [None] * len(interval_ids)
+            interval_uuids = np.char.decode(arrays['interval_uuid']).tolist()
+
+        intervals = [ExclusionInterval.from_tuple(values)
+                     for values in zip(interval_ids, charges, *bounds, exclusions, data, interval_uuids)]
+        self.interval_tree = IntervalTree(get_mass_interval(interval) for interval in intervals)
+        self.build_index()
+
+    def build_index(self) -> None:
+        """
+        Rebuild the id and UUID lookup tables from the intervals stored in the interval tree. This is required
+        after the interval tree has been replaced in bulk (e.g. when loading from a file).
+        """
+        self.id_dict = {}
+        self.uuid_dict = {}
+        for interval in self.interval_tree:
+            data = interval.data
+            self.id_dict.setdefault(data.interval_id, set()).add(interval)
+            self.uuid_dict[data.interval_uuid] = data
+        self._changed()
+
+    def get_snapshot(self) -> Tuple[List[Interval], ExclusionIntervalArray]:
+        """
+        Get a column-oriented copy of the stored intervals, used to scan all intervals with vectorized operations.
+        The snapshot is built on the first call after the tree has changed and reused until the next change.
+
+        Returns:
+            Tuple[List[Interval], ExclusionIntervalArray]: The Intervals of the interval tree sorted by their lower
+             mass bound, and an ExclusionIntervalArray of their ExclusionIntervals in the same order.
         """
-        with open(file_path, "rb") as file:
-            self.interval_tree = pickle.load(file)
-            self.id_dict = {}
-            for interval in self.interval_tree:
-                data = interval.data
-                self.id_dict.setdefault(data.interval_id, set()).add(interval)
+        if self._snapshot is None:
+            mass_intervals = sorted(self.interval_tree, key=lambda mass_interval: mass_interval.begin)
+            intervals = [mass_interval.data for mass_interval in mass_intervals]
+            self._snapshot = (mass_intervals, ExclusionIntervalArray.from_list(intervals))
+        return self._snapshot
 
     def clear(self) -> None:
         """
@@ -301,6 +577,7 @@ class MassIntervalTree:
         self.interval_tree.clear()
         self.id_dict = {}
         self.uuid_dict = {}
+        self._changed()
 
     def __len__(self):
         """
@@ -1,6 +1,9 @@
+import random
 import unittest
+from copy import copy, deepcopy
 
-from exclusionms.components import ExclusionInterval, ExclusionPoint
+from exclusionms.components import ExclusionInterval, ExclusionPoint, ExclusionIntervalArray, \
+    BOUND_FIELDS, ExclusionPointBatch, POINT_FIELDS
 
 interval1 = ExclusionInterval(interval_id='PEPTIDE',
                               charge=1,
@@ -25,6 +28,129 @@ interval2 = ExclusionInterval(interval_id=None,
                               max_intensity=None)
 
 
+# intervals shared by the envelope tests
+NONE_IV = ExclusionInterval(interval_id=None,
+                            charge=None,
+                            min_mass=None,
+                            max_mass=None,
+                            min_rt=None,
+                            max_rt=None,
+                            min_ook0=None,
+                            max_ook0=None,
+                            min_intensity=None,
+                            max_intensity=None)
+
+NONE_IV_CH2 = ExclusionInterval(interval_id=None,
+                                charge=2,
+                                min_mass=None,
+                                max_mass=None,
+                                min_rt=None,
+                                max_rt=None,
+                                min_ook0=None,
+                                max_ook0=None,
+                                min_intensity=None,
+                                max_intensity=None)
+
+MASS_1000_1001 = ExclusionInterval(interval_id=None,
+                                   charge=None,
+                                   min_mass=1000,
+                                   max_mass=1001,
+                                   min_rt=None,
+                                   max_rt=None,
+                                   min_ook0=None,
+                                   max_ook0=None,
+                                   min_intensity=None,
+                                   max_intensity=None)
+
+MASS_1000_1001_CH1 = ExclusionInterval(interval_id=None,
+                                       charge=1,
+                                       min_mass=1000,
+                                       max_mass=1001,
+                                       min_rt=None,
+                                       max_rt=None,
+                                       min_ook0=None,
+                                       max_ook0=None,
+                                       min_intensity=None,
+                                       max_intensity=None)
+
+MASS_999_1002 = ExclusionInterval(interval_id=None,
+                                  charge=None,
+                                  min_mass=999,
+                                  max_mass=1002,
+                                  min_rt=None,
+                                  max_rt=None,
+                                  min_ook0=None,
+                                  max_ook0=None,
+                                  min_intensity=None,
+                                  max_intensity=None)
+
+MASS_999_1002_CH1 = ExclusionInterval(interval_id=None,
+                                      charge=1,
+                                      min_mass=999,
+                                      max_mass=1002,
+                                      min_rt=None,
+                                      max_rt=None,
+                                      min_ook0=None,
+                                      max_ook0=None,
+                                      min_intensity=None,
+                                      max_intensity=None)
+
+ALL_1000_1001_CH1 = ExclusionInterval(interval_id=None,
+                                      charge=1,
+                                      min_mass=1000,
+                                      max_mass=1001,
+                                      min_rt=1000,
+                                      max_rt=1001,
+                                      min_ook0=1000,
+                                      max_ook0=1001,
+                                      min_intensity=1000,
+                                      max_intensity=1001)
+
+ALL_1000_1002_CH1 = ExclusionInterval(interval_id=None,
+                                      charge=1,
+                                      min_mass=1000,
+                                      max_mass=1002,
+                                      min_rt=1000,
+                                      max_rt=1002,
+                                      min_ook0=1000,
+                                      max_ook0=1002,
+                                      min_intensity=1000,
+                                      max_intensity=1002)
+
+ALL_999_1001_CH1 = ExclusionInterval(interval_id=None,
+                                     charge=1,
+                                     min_mass=999,
+                                     max_mass=1001,
+                                     min_rt=999,
+                                     max_rt=1001,
+                                     min_ook0=999,
+                                     max_ook0=1001,
+                                     min_intensity=999,
+                                     max_intensity=1001)
+
+LOWER_1000 = ExclusionInterval(interval_id=None,
+                               charge=None,
+                               min_mass=1000,
+                               max_mass=None,
+                               min_rt=1000,
+                               max_rt=None,
+                               min_ook0=1000,
+                               max_ook0=None,
+                               min_intensity=1000,
+                               max_intensity=None)
+
+UPPER_1000 = ExclusionInterval(interval_id=None,
+                               charge=None,
+                               min_mass=None,
+                               max_mass=1000,
+                               min_rt=None,
+                               max_rt=1000,
+                               min_ook0=None,
+                               max_ook0=1000,
+                               min_intensity=None,
+                               max_intensity=1000)
+
+
 class TestExclusionList(unittest.TestCase):
 
     def test_create(self):
@@ -54,277 +180,34 @@ class TestExclusionList(unittest.TestCase):
     def test_interval_envelope(self):
         self.assertTrue(interval1.is_enveloped_by(interval2))
         self.assertFalse(interval2.is_enveloped_by(interval1))
-
-        self.assertTrue(
-            ExclusionInterval(interval_id=None,
-                              charge=None,
-                              min_mass=1000,
-                              max_mass=1001,
-                              min_rt=None,
-                              max_rt=None,
-                              min_ook0=None,
-                              max_ook0=None,
-                              min_intensity=None,
-                              max_intensity=None).is_enveloped_by(
-                ExclusionInterval(interval_id=None,
-                                  charge=1,
-                                  min_mass=999,
-                                  max_mass=1002,
-                                  min_rt=None,
-                                  max_rt=None,
-                                  min_ook0=None,
-                                  max_ook0=None,
-                                  min_intensity=None,
-                                  max_intensity=None)))
-
-        self.assertTrue(
-            ExclusionInterval(interval_id=None,
-                              charge=1,
-                              min_mass=1000,
-                              max_mass=1001,
-                              min_rt=None,
-                              max_rt=None,
-                              min_ook0=None,
-                              max_ook0=None,
-                              min_intensity=None,
-                              max_intensity=None).is_enveloped_by(
-                ExclusionInterval(interval_id=None,
-                                  charge=None,
-                                  min_mass=999,
-                                  max_mass=1002,
-                                  min_rt=None,
-                                  max_rt=None,
-                                  min_ook0=None,
-                                  max_ook0=None,
-                                  min_intensity=None,
-                                  max_intensity=None)))
+        self.assertTrue(MASS_1000_1001.is_enveloped_by(MASS_999_1002_CH1))
+        self.assertTrue(MASS_1000_1001_CH1.is_enveloped_by(MASS_999_1002))
 
     def test_interval_envelope_equal(self):
-        self.assertTrue(
-            ExclusionInterval(interval_id=None,
-                              charge=1,
-                              min_mass=1000,
-                              max_mass=1001,
-                              min_rt=None,
-                              max_rt=None,
-                              min_ook0=None,
-                              max_ook0=None,
-                              min_intensity=None,
-                              max_intensity=None).is_enveloped_by(
-                ExclusionInterval(interval_id=None,
-                                  charge=1,
-                                  min_mass=1000,
-                                  max_mass=1001,
-                                  min_rt=None,
-                                  max_rt=None,
-                                  min_ook0=None,
-                                  max_ook0=None,
-                                  min_intensity=None,
-                                  max_intensity=None)))
+        self.assertTrue(MASS_1000_1001_CH1.is_enveloped_by(MASS_1000_1001_CH1))
 
     def test_interval_envelope_lower_bounds(self):
-        self.assertTrue(
-            ExclusionInterval(interval_id=None,
-                              charge=1,
-                              min_mass=1000,
-                              max_mass=1001,
-                              min_rt=1000,
-                              max_rt=1001,
-                              min_ook0=1000,
-                              max_ook0=1001,
-                              min_intensity=1000,
-                              max_intensity=1001).is_enveloped_by(
-                ExclusionInterval(interval_id=None,
-                                  charge=1,
-                                  min_mass=1000,
-                                  max_mass=1002,
-                                  min_rt=1000,
-                                  max_rt=1002,
-                                  min_ook0=1000,
-                                  max_ook0=1002,
-                                  min_intensity=1000,
-                                  max_intensity=1002)))
+        self.assertTrue(ALL_1000_1001_CH1.is_enveloped_by(ALL_1000_1002_CH1))
 
     def test_interval_envelope_upper_bounds(self):
-        self.assertTrue(
-            ExclusionInterval(interval_id=None,
-                              charge=1,
-                              min_mass=1000,
-                              max_mass=1001,
-                              min_rt=1000,
-                              max_rt=1001,
-                              min_ook0=1000,
-                              max_ook0=1001,
-                              min_intensity=1000,
-                              max_intensity=1001).is_enveloped_by(
-                ExclusionInterval(interval_id=None,
-                                  charge=1,
-                                  min_mass=999,
-                                  max_mass=1001,
-                                  min_rt=999,
-                                  max_rt=1001,
-                                  min_ook0=999,
-                                  max_ook0=1001,
-                                  min_intensity=999,
-                                  max_intensity=1001)))
+        self.assertTrue(ALL_1000_1001_CH1.is_enveloped_by(ALL_999_1001_CH1))
 
     def test_interval_envelope_equal_none(self):
-        self.assertTrue(
-            ExclusionInterval(interval_id=None,
-                              charge=None,
-                              min_mass=None,
-                              max_mass=None,
-                              min_rt=None,
-                              max_rt=None,
-                              min_ook0=None,
-                              max_ook0=None,
-                              min_intensity=None,
-                              max_intensity=None).is_enveloped_by(
-                ExclusionInterval(interval_id=None,
-                                  charge=None,
-                                  min_mass=None,
-                                  max_mass=None,
-                                  min_rt=None,
-                                  max_rt=None,
-                                  min_ook0=None,
-                                  max_ook0=None,
-                                  min_intensity=None,
-                                  max_intensity=None)))
+        self.assertTrue(NONE_IV.is_enveloped_by(NONE_IV))
 
-        def test_interval_envelope_none_with_charge(self):
-            self.assertTrue(
-                ExclusionInterval(interval_id=None,
-                                  charge=2,
-                                  min_mass=None,
-                                  max_mass=None,
-                                  min_rt=None,
-                                  max_rt=None,
-                                  min_ook0=None,
-                                  max_ook0=None,
-                                  min_intensity=None,
-                                  max_intensity=None).is_enveloped_by(
-                    ExclusionInterval(interval_id=None,
-                                      charge=None,
-                                      min_mass=None,
-                                      max_mass=None,
-                                      min_rt=None,
-                                      max_rt=None,
-                                      min_ook0=None,
-                                      max_ook0=None,
-                                      min_intensity=None,
-                                      max_intensity=None)))
-
-            self.assertFalse(
-                ExclusionInterval(interval_id=None,
-                                  charge=None,
-                                  min_mass=None,
-                                  max_mass=None,
-                                  min_rt=None,
-                                  max_rt=None,
-                                  min_ook0=None,
-                                  max_ook0=None,
-                                  min_intensity=None,
-                                  max_intensity=None).is_enveloped_by(
-                    ExclusionInterval(interval_id=None,
-                                      charge=2,
-                                      min_mass=None,
-                                      max_mass=None,
-                                      min_rt=None,
-                                      max_rt=None,
-                                      min_ook0=None,
-                                      max_ook0=None,
-                                      min_intensity=None,
-                                      max_intensity=None)))
+    def test_interval_envelope_none_with_charge(self):
+        # a None charge matches any charge, in either interval
+        self.assertTrue(NONE_IV_CH2.is_enveloped_by(NONE_IV))
+        self.assertTrue(NONE_IV.is_enveloped_by(NONE_IV_CH2))
+        self.assertTrue(NONE_IV_CH2.is_enveloped_by(NONE_IV_CH2))
 
     def test_interval_envelope_none_with_lower(self):
-        self.assertTrue(
-            ExclusionInterval(interval_id=None,
-                              charge=None,
-                              min_mass=1000,
-                              max_mass=None,
-                              min_rt=1000,
-                              max_rt=None,
-                              min_ook0=1000,
-                              max_ook0=None,
-                              min_intensity=1000,
-                              max_intensity=None).is_enveloped_by(
-                ExclusionInterval(interval_id=None,
-                                  charge=None,
-                                  min_mass=None,
-                                  max_mass=None,
-                                  min_rt=None,
-                                  max_rt=None,
-                                  min_ook0=None,
-                                  max_ook0=None,
-                                  min_intensity=None,
-                                  max_intensity=None)))
-
-        self.assertFalse(
-            ExclusionInterval(interval_id=None,
-                              charge=None,
-                              min_mass=None,
-                              max_mass=None,
-                              min_rt=None,
-                              max_rt=None,
-                              min_ook0=None,
-                              max_ook0=None,
-                              min_intensity=None,
-                              max_intensity=None).is_enveloped_by(
-                ExclusionInterval(interval_id=None,
-                                  charge=None,
-                                  min_mass=1000,
-                                  max_mass=None,
-                                  min_rt=1000,
-                                  max_rt=None,
-                                  min_ook0=1000,
-                                  max_ook0=None,
-                                  min_intensity=1000,
-                                  max_intensity=None)))
+        self.assertTrue(LOWER_1000.is_enveloped_by(NONE_IV))
+        self.assertFalse(NONE_IV.is_enveloped_by(LOWER_1000))
 
     def test_interval_envelope_none_with_upper(self):
-        self.assertTrue(
-            ExclusionInterval(interval_id=None,
-                              charge=None,
-                              min_mass=None,
-                              max_mass=1000,
-                              min_rt=None,
-                              max_rt=1000,
-                              min_ook0=None,
-                              max_ook0=1000,
-                              min_intensity=None,
-                              max_intensity=1000).is_enveloped_by(
-                ExclusionInterval(interval_id=None,
-                                  charge=None,
-                                  min_mass=None,
-                                  max_mass=None,
-                                  min_rt=None,
-                                  max_rt=None,
-                                  min_ook0=None,
-                                  max_ook0=None,
-                                  min_intensity=None,
-                                  max_intensity=None)))
-
-        self.assertFalse(
-            ExclusionInterval(interval_id=None,
-                              charge=None,
-                              min_mass=None,
-                              max_mass=None,
-                              min_rt=None,
-                              max_rt=None,
-                              min_ook0=None,
-                              max_ook0=None,
-                              min_intensity=None,
-                              max_intensity=None).is_enveloped_by(
-                ExclusionInterval(interval_id=None,
-                                  charge=None,
-                                  min_mass=None,
-                                  max_mass=1000,
-                                  min_rt=None,
-                                  max_rt=1000,
-                                  min_ook0=None,
-                                  max_ook0=1000,
-                                  min_intensity=None,
-                                  max_intensity=1000)))
+        self.assertTrue(UPPER_1000.is_enveloped_by(NONE_IV))
+        self.assertFalse(NONE_IV.is_enveloped_by(UPPER_1000))
 
     def test_interval_envelope_id(self):
         self.assertTrue(interval1.is_enveloped_by(interval2))
@@ -458,6 +341,197 @@ class TestExclusionList(unittest.TestCase):
                                   min_intensity=999,
                                   max_intensity=1000)))
 
+    def test_interval_array_envelope(self):
+        self.assertTrue(ExclusionIntervalArray.from_list([interval1]).is_enveloped_by(interval2)[0])
+        self.assertFalse(ExclusionIntervalArray.from_list([interval2]).is_enveloped_by(interval1)[0])
+
+    def test_interval_array_envelope_matches_scalar(self):
+        intervals = [interval1,
+                     interval2,
+                     ExclusionInterval(interval_id=None, charge=None,
+                                       min_mass=1000, max_mass=1001,
+                                       min_rt=None, max_rt=None,
+                                       min_ook0=None, max_ook0=None,
+                                       min_intensity=None, max_intensity=None),
+                     ExclusionInterval(interval_id=None, charge=2,
+                                       min_mass=1000, max_mass=1001,
+                                       min_rt=2000, max_rt=2001,
+                                       min_ook0=None, max_ook0=None,
+                                       min_intensity=None, max_intensity=None)]
+        queries = intervals + [ExclusionInterval(interval_id=None, charge=1,
+                                                 min_mass=999, max_mass=1002,
+                                                 min_rt=None, max_rt=None,
+                                                 min_ook0=None, max_ook0=None,
+                                                 min_intensity=None, max_intensity=None)]
+
+        interval_array = ExclusionIntervalArray.from_list(intervals)
+        for query in queries:
+            self.assertEqual([interval.is_enveloped_by(query) for interval in intervals],
+                             interval_array.is_enveloped_by(query).tolist())
+
+    def test_point_frozen(self):
+        point = ExclusionPoint(charge=1, mass=1000.5, rt=None, ook0=None, intensity=None)
+        self.assertEqual(hash(point), hash(ExclusionPoint(charge=1, mass=1000.5, rt=None, ook0=None, intensity=None)))
+        self.assertEqual(1, len({point, ExclusionPoint(charge=1, mass=1000.5, rt=None, ook0=None, intensity=None)}))
+        with self.assertRaises((TypeError, ValueError)):
+            point.mass = 1001
+
+    def test_interval_bounds(self):
+        self.assertEqual((1000, 1001, 2000, 2001, 3000, 3001, 4000, 4001), interval1.bounds)
+        self.assertEqual((float('-inf'), float('inf')) * 4, interval2.bounds)
+
+        interval = ExclusionInterval(interval_id=None, charge=None,
+                                     min_mass=None, max_mass=None,
+                                     min_rt=None, max_rt=None,
+                                     min_ook0=None, max_ook0=None,
+                                     min_intensity=None, max_intensity=None)
+        self.assertEqual(float('-inf'), interval.bounds[0])
+        interval.min_mass = 1000
+        self.assertEqual(1000, interval.bounds[0])
+        self.assertFalse(ExclusionPoint(charge=None, mass=999, rt=None, ook0=None, intensity=None)
+                         .is_bounded_by(interval))
+
+    def test_interval_envelope_reassigned(self):
+        interval = ExclusionInterval(interval_id=None, charge=1,
+                                     min_mass=1000, max_mass=1001,
+                                     min_rt=None, max_rt=None,
+                                     min_ook0=None, max_ook0=None,
+                                     min_intensity=None, max_intensity=None)
+        self.assertTrue(interval.is_enveloped_by(interval2))
+        self.assertTrue(interval.is_enveloped_by(interval2))
+        self.assertFalse(interval2.is_enveloped_by(interval))
+
+        # reassigned bounds and charges are picked up
+        interval.max_mass = None
+        self.assertFalse(interval.is_enveloped_by(interval1))
+        interval.max_mass = 1001
+        interval.charge = 2
+        self.assertFalse(interval.is_enveloped_by(interval1))
+
+    def test_interval_from_tuple(self):
+        interval = ExclusionInterval.from_tuple(('PEPTIDE', 1, 1000, 1001, 2000, 2001, 3000, 3001, 4000, 4001))
+        self.assertEqual(interval1, interval)
+        self.assertTrue(interval.exclusion)
+        self.assertIsNone(interval.interval_uuid)
+        self.assertEqual(interval1.bounds, interval.bounds)
+
+        interval = ExclusionInterval.from_tuple((None, None, None, None, None, None, None, None, None, None,
+                                                 False, 'data', 'uuid'))
+        self.assertFalse(interval.exclusion)
+        self.assertEqual('data', interval.data)
+        self.assertEqual('uuid', interval.interval_uuid)
+
+    def test_interval_array_envelope_single_matches_scalar(self):
+        rng = random.Random(0)
+
+        def random_interval():
+            bounds = [rng.choice([None, rng.uniform(0, 10)]) for _ in range(8)]
+            return ExclusionInterval(interval_id=None, charge=rng.choice([None, 1, 2]),
+                                     **dict(zip(BOUND_FIELDS, bounds)))
+
+        for _ in range(500):
+            interval, other = random_interval(), random_interval()
+            self.assertEqual(interval.is_enveloped_by(other),
+                             ExclusionIntervalArray.from_list([interval]).is_enveloped_by(other)[0])
+
+    def test_point_batch_is_bounded_by(self):
+        point1 = ExclusionPoint(charge=1, mass=1000.5, rt=2000.5, ook0=3000.5, intensity=4000.5)
+        self.assertTrue(ExclusionPointBatch.from_points([point1]).is_bounded_by(
+            ExclusionIntervalArray.from_list([interval1]))[0, 0])
+
+        points = [point1,
+                  ExclusionPoint(charge=None, mass=None, rt=None, ook0=None, intensity=None),
+                  ExclusionPoint(charge=2, mass=1000.5, rt=None, ook0=None, intensity=None),
+                  ExclusionPoint(charge=1, mass=1001, rt=None, ook0=None, intensity=None),
+                  ExclusionPoint(charge=None, mass=1000, rt=2000, ook0=None, intensity=4001)]
+        intervals = [interval1, interval2]
+
+        batch = ExclusionPointBatch.from_points(points)
+        self.assertEqual([True, False, True, True, False], batch.is_valid('charge').tolist())
+        self.assertEqual([[point.is_bounded_by(interval) for interval in intervals] for point in points],
+                         batch.is_bounded_by(ExclusionIntervalArray.from_list(intervals)).tolist())
+
+    def test_point_batch_from_array(self):
+        points = [ExclusionPoint(charge=1, mass=1000.5, rt=2000.5, ook0=3000.5, intensity=4000.5),
+                  ExclusionPoint(charge=None, mass=None, rt=None, ook0=None, intensity=None),
+                  ExclusionPoint(charge=2, mass=1000.5, rt=None, ook0=0.0, intensity=None)]
+        array = [[float('nan') if getattr(point, field) is None else getattr(point, field) for field in POINT_FIELDS]
+                 for point in points]
+
+        batch = ExclusionPointBatch.from_array(array)
+        expected = ExclusionPointBatch.from_points(points)
+        self.assertEqual(expected.values.tolist(), batch.values.tolist())
+        self.assertEqual(expected.mask.tolist(), batch.mask.tolist())
+
+    def test_interval_array_contains_point(self):
+        rng = random.Random(0)
+        intervals = [ExclusionInterval(interval_id=None, charge=rng.choice([None, 1, 2]),
+                                       **{field: rng.choice([None, rng.uniform(0, 10)]) for field in BOUND_FIELDS})
+                     for _ in range(200)]
+        interval_array = ExclusionIntervalArray.from_list(intervals)
+
+        for _ in range(50):
+            values = [rng.choice([None, 1, 2])] + [rng.choice([None, rng.uniform(0, 10)]) for _ in range(4)]
+            point = ExclusionPoint(**dict(zip(POINT_FIELDS, values)))
+            self.assertEqual([point.is_bounded_by(interval) for interval in intervals],
+                             interval_array.contains_point(point).tolist())
+
+    def test_interval_array_charge_dtype(self):
+        def charged(charge):
+            return ExclusionInterval(interval_id=None, charge=charge, **dict.fromkeys(BOUND_FIELDS))
+
+        self.assertEqual('int8', ExclusionIntervalArray.from_list([charged(1), charged(None)]).charge.dtype)
+        interval_array = ExclusionIntervalArray.from_list([charged(1), charged(300)])
+        self.assertEqual('int64', interval_array.charge.dtype)
+        self.assertEqual([False, True], interval_array.contains_point(
+            ExclusionPoint(charge=300, mass=None, rt=None, ook0=None, intensity=None)).tolist())
+
+    def test_point_batch_is_bounded_by_matches_scalar(self):
+        rng = random.Random(0)
+        intervals = [ExclusionInterval(interval_id=None, charge=rng.choice([None, 1, 2]),
+                                       **{field: rng.choice([None, rng.uniform(0, 10)]) for field in BOUND_FIELDS})
+                     for _ in range(100)]
+        points = [ExclusionPoint(**dict(zip(POINT_FIELDS, [rng.choice([None, 1, 2])] +
+                                            [rng.choice([None, rng.uniform(0, 10)]) for _ in range(4)])))
+                  for _ in range(50)]
+
+        self.assertEqual([[point.is_bounded_by(interval) for interval in intervals] for point in points],
+                         ExclusionPointBatch.from_points(points).is_bounded_by(
+                             ExclusionIntervalArray.from_list(intervals)).tolist())
+
+    def test_interval_deepcopy(self):
+        interval = ExclusionInterval(interval_id='PEPTIDE', charge=1,
+                                     min_mass=1000, max_mass=1001,
+                                     min_rt=None, max_rt=None,
+                                     min_ook0=None, max_ook0=None,
+                                     min_intensity=None, max_intensity=None,
+                                     data={'scans': [1, 2]}, interval_uuid='uuid')
+        interval_copy = deepcopy(interval)
+        self.assertIsNot(interval, interval_copy)
+        self.assertEqual(interval, interval_copy)
+        self.assertEqual(interval.data, interval_copy.data)
+
+        interval_copy.data['scans'].append(3)
+        interval_copy.min_mass = 999
+        self.assertEqual([1, 2], interval.data['scans'])
+        self.assertEqual(1000, interval.min_mass)
+
+    def test_point_hash(self):
+        point = ExclusionPoint(charge=1, mass=1000.5, rt=None, ook0=None, intensity=1000.5)
+        same_point = ExclusionPoint(charge=1, mass=1000.5, rt=None, ook0=None, intensity=1000.5)
+        other_point = ExclusionPoint(charge=1, mass=1000.5, rt=None, ook0=1.0, intensity=1000.5)
+        self.assertEqual(hash(point), hash(same_point))
+        self.assertEqual({point: 1}[same_point], 1)
+        self.assertEqual(2, len({point, same_point, other_point}))
+        self.assertNotEqual(point, other_point)
+        self.assertNotEqual(point, 'point')
+
+    def test_point_copy(self):
+        point = ExclusionPoint(charge=1, mass=1000.5, rt=None, ook0=None, intensity=1000.5)
+        self.assertIs(point, copy(point))
+        self.assertIs(point, deepcopy(point))
+        self.assertEqual([point], deepcopy([point]))
+
 
 if __name__ == '__main__':
     unittest.main()
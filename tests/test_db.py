@@ -1,7 +1,14 @@
+import io
+import os
+import random
+import tempfile
 import unittest
-from copy import deepcopy
+from copy import copy
+from unittest import mock
 
-from exclusionms.components import ExclusionInterval, ExclusionPoint
+import numpy as np
+
+from exclusionms.components import ExclusionInterval, ExclusionPoint, ExclusionPointBatch, BOUND_FIELDS, POINT_FIELDS
 from exclusionms.db import MassIntervalTree as ExclusionList, IntervalStatus
 
 intervals = [
@@ -27,12 +34,25 @@ intervals = [
                       max_intensity=1001)
 ]
 
+# the center of intervals[0]; tests override single fields of it
+CENTER_POINT = dict(charge=1, mass=1000.5, rt=1000.5, ook0=1000.5, intensity=1000.5)
+
 
 class TestExclusionList(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls) -> None:
+        # built once and shared by the tests that only query it, so it must not be modified
+        cls.populated = ExclusionList()
+        cls.populated.add(intervals[0])
+
     def setUp(self) -> None:
         self.exlist = ExclusionList()
 
+    def tearDown(self) -> None:
+        # fails the test that modified the shared tree, instead of the tests that query it afterwards
+        self.assertEqual(1, len(self.populated))
+
     def test_add(self):
         self.exlist.add(intervals[0])
         self.assertEqual(1, len(self.exlist))
@@ -47,8 +67,61 @@ class TestExclusionList(unittest.TestCase):
     def test_duplicate_add(self):
         self.exlist.add(intervals[0])
         self.assertEqual(1, len(self.exlist))
+        interval_uuid = intervals[0].interval_uuid
         self.exlist.add(intervals[0])
         self.assertEqual(1, len(self.exlist))
+        self.assertEqual(interval_uuid, intervals[0].interval_uuid)
+        self.assertEqual(1, self.exlist.stats()['uuid_dict'])
+
+    def test_add_many(self):
+        extra = ExclusionInterval(interval_id='OTHER', charge=None, min_mass=None, max_mass=None,
+                                  min_rt=None, max_rt=None, min_ook0=None, max_ook0=None,
+                                  min_intensity=None, max_intensity=None)
+        self.exlist.add_many([intervals[0], intervals[1], intervals[0]])
+        self.assertEqual(2, len(self.exlist))
+        self.exlist.add_many([extra, intervals[1]])
+        self.assertEqual(3, len(self.exlist))
+        self.assertEqual(3, self.exlist.stats()['uuid_dict'])
+        self.assertEqual(2, len(self.exlist.query_by_id('PEPTIDE')))
+        self.assertTrue(self.exlist.is_excluded(ExclusionPoint(**CENTER_POINT)))
+
+        with self.assertRaises(ValueError):
+            self.exlist.add_many([ExclusionInterval(interval_id=None, charge=None, **dict.fromkeys(BOUND_FIELDS))])
+        self.assertEqual(3, len(self.exlist))
+
+    def test_add_many_null_interval(self):
+        ok = ExclusionInterval(interval_id='A', charge=None, min_mass=1000, max_mass=1001,
+                               **dict.fromkeys(BOUND_FIELDS[2:]))
+        null = ExclusionInterval(interval_id='B', charge=None, min_mass=1000, max_mass=1000,
+                                 **dict.fromkeys(BOUND_FIELDS[2:]))
+        for exlist in (ExclusionList(), self.populated):
+            size = len(exlist)
+            with self.assertRaises(ValueError):
+                exlist.add_many([ok, null])
+            self.assertEqual(size, len(exlist))
+            self.assertEqual(size, exlist.stats()['uuid_dict'])
+            self.assertNotIn('A', exlist.id_dict)
+            self.assertNotIn('B', exlist.id_dict)
+
+    def test_add_interns_ids(self):
+        # ids built at runtime, so they are equal but distinct string objects
+        added = [ExclusionInterval(interval_id=''.join(['PEP', 'TIDE']), charge=None, min_mass=1000, max_mass=1001,
+                                   **dict.fromkeys(BOUND_FIELDS[2:]))
+                 for _ in range(3)]
+        self.exlist.add(added[0])
+        self.exlist.add_many(added[1:])
+        self.assertTrue(all(interval.interval_id is added[0].interval_id for interval in added))
+        self.assertEqual(3, len(self.exlist.query_by_id('PEPTIDE')))
+
+        # ids that are not str (possible when validation is skipped) are stored as they are
+        numbered = [ExclusionInterval(interval_id='7', charge=None, min_mass=1000, max_mass=1001,
+                                      **dict.fromkeys(BOUND_FIELDS[2:]))
+                    for _ in range(2)]
+        for interval in numbered:
+            interval.interval_id = 7
+        self.exlist.add(numbered[0])
+        self.exlist.add_many(numbered[1:])
+        self.assertEqual(2, len(self.exlist.query_by_id(7)))
 
     def test_remove(self):
         self.exlist.remove(intervals[0])
@@ -67,7 +140,7 @@ class TestExclusionList(unittest.TestCase):
     def test_add_remove(self):
         self.exlist.add(intervals[0])
         self.assertEqual(1, len(self.exlist))
-        tmp_msg = deepcopy(intervals[0])
+        tmp_msg = copy(intervals[0])
         self.exlist.remove(tmp_msg)
         self.assertEqual(0, len(self.exlist))
 
@@ -88,229 +161,79 @@ class TestExclusionList(unittest.TestCase):
         self.assertEqual(0, len(self.exlist))
 
     def test_exclude(self):
-        self.exlist.add(intervals[0])
-        self.assertEqual(1, len(self.exlist))
-        self.assertTrue(self.exlist.is_excluded(ExclusionPoint(charge=1, mass=1000.5, rt=1000.5,
-                                                               ook0=1000.5, intensity=1000.5)))
-
-    def test_exclude_lower_mass(self):
-        self.exlist.add(intervals[0])
-        self.assertEqual(1, len(self.exlist))
-        self.assertTrue(self.exlist.is_excluded(ExclusionPoint(charge=1, mass=1000, rt=1000.5,
-                                                               ook0=1000.5, intensity=1000.5)))
-
-    def test_exclude_upper_mass(self):
-        self.exlist.add(intervals[0])
-        self.assertEqual(1, len(self.exlist))
-        self.assertFalse(self.exlist.is_excluded(ExclusionPoint(charge=1, mass=1001, rt=1000.5,
-                                                                ook0=1000.5, intensity=1000.5)))
-
-    def test_exclude_lower_retention_time(self):
-        self.exlist.add(intervals[0])
-        self.assertEqual(1, len(self.exlist))
-        self.assertTrue(self.exlist.is_excluded(ExclusionPoint(charge=1, mass=1000.5, rt=1000,
-                                                               ook0=1000.5, intensity=1000.5)))
+        self.assertTrue(self.populated.is_excluded(ExclusionPoint(**CENTER_POINT)))
 
-    def test_exclude_upper_retention_time(self):
-        self.exlist.add(intervals[0])
-        self.assertEqual(1, len(self.exlist))
-        self.assertFalse(self.exlist.is_excluded(ExclusionPoint(charge=1, mass=1000.5, rt=1001,
-                                                                ook0=1000.5, intensity=1000.5)))
+    def test_exclude_bounds(self):
+        # lower bounds are inclusive and upper bounds are exclusive, in every dimension
+        cases = [(field, value, value == 1000)
+                 for field in ('mass', 'rt', 'ook0', 'intensity') for value in (1000, 1001)]
+        points = [ExclusionPoint(**{**CENTER_POINT, field: value}) for field, value, _ in cases]
 
-    def test_exclude_lower_ook0(self):
-        self.exlist.add(intervals[0])
-        self.assertEqual(1, len(self.exlist))
-        self.assertTrue(self.exlist.is_excluded(ExclusionPoint(charge=1, mass=1000.5, rt=1000.5,
-                                                               ook0=1000, intensity=1000.5)))
-
-    def test_exclude_upper_ook0(self):
-        self.exlist.add(intervals[0])
-        self.assertEqual(1, len(self.exlist))
-        self.assertFalse(self.exlist.is_excluded(ExclusionPoint(charge=1, mass=1000.5, rt=1000.5,
-                                                                ook0=1001, intensity=1000.5)))
-
-    def test_exclude_lower_intensity(self):
-        self.exlist.add(intervals[0])
-        self.assertEqual(1, len(self.exlist))
-        self.assertTrue(self.exlist.is_excluded(ExclusionPoint(charge=1, mass=1000.5, rt=1000.5,
-                                                               ook0=1000.5, intensity=1000)))
-
-    def test_exclude_upper_intensity(self):
-        self.exlist.add(intervals[0])
-        self.assertEqual(1, len(self.exlist))
-        self.assertFalse(self.exlist.is_excluded(ExclusionPoint(charge=1, mass=1000.5, rt=1000.5,
-                                                                ook0=1000.5, intensity=1001)))
+        for (field, value, expected), point in zip(cases, points):
+            with self.subTest(field=field, value=value):
+                self.assertEqual(expected, self.populated.is_excluded(point))
+        self.assertEqual([expected for _, _, expected in cases], self.populated.are_excluded(points).tolist())
 
     def test_exclude_wrong_charge(self):
-        self.exlist.add(intervals[0])
-        self.assertEqual(1, len(self.exlist))
-        print(list(self.exlist.query_by_point(ExclusionPoint(charge=2, mass=1000.5, rt=1000.5,
-                                                             ook0=1000.5, intensity=1000.5))))
-        self.assertFalse(self.exlist.is_excluded(ExclusionPoint(charge=2, mass=1000.5, rt=1000.5,
-                                                                ook0=1000.5, intensity=1000.5)))
+        point = ExclusionPoint(**{**CENTER_POINT, 'charge': 2})
+        self.assertEqual([], list(self.populated.query_by_point(point)))
+        self.assertFalse(self.populated.is_excluded(point))
+
+    def test_none_point_attributes(self):
+        # a None value matches any interval bound
+        none_fields = [('charge',), ('mass',), ('rt',), ('ook0',), ('ook0', 'intensity')]
+        points = [ExclusionPoint(**{**CENTER_POINT, **dict.fromkeys(fields)}) for fields in none_fields]
+        # the same points packed as rows of POINT_FIELDS, with NaN for None
+        rows = [[float('nan') if getattr(point, field) is None else getattr(point, field) for field in POINT_FIELDS]
+                for point in points]
+
+        for fields, point in zip(none_fields, points):
+            with self.subTest(none_fields=fields):
+                self.assertTrue(self.populated.is_excluded(point))
+        self.assertEqual([True] * len(points),
+                         self.populated.are_excluded(ExclusionPointBatch.from_array(rows)).tolist())
 
-    def test_none_point_charge(self):
-        self.exlist.add(intervals[0])
-        self.assertEqual(1, len(self.exlist))
-        self.assertTrue(
-            self.exlist.is_excluded(ExclusionPoint(charge=None, mass=1000.5, rt=1000.5,
-                                                   ook0=1000.5, intensity=1000.5)))
-
-    def test_none_point_mass(self):
-        self.exlist.add(intervals[0])
-        self.assertEqual(1, len(self.exlist))
-        self.assertTrue(
-            self.exlist.is_excluded(ExclusionPoint(charge=1, mass=None, rt=1000.5,
-                                                   ook0=1000.5, intensity=1000.5)))
-
-    def test_none_point_rt(self):
-        self.exlist.add(intervals[0])
-        self.assertEqual(1, len(self.exlist))
-        self.assertTrue(
-            self.exlist.is_excluded(ExclusionPoint(charge=1, mass=1000.5, rt=None,
-                                                   ook0=1000.5, intensity=1000.5)))
-
-    def test_none_point_ook0(self):
-        self.exlist.add(intervals[0])
-        self.assertEqual(1, len(self.exlist))
-        self.assertTrue(
-            self.exlist.is_excluded(ExclusionPoint(charge=1, mass=1000.5, rt=1000.5,
-                                                   ook0=None, intensity=1000.5)))
+    def test_none_interval_attributes(self):
 
-    def test_none_point_intensity(self):
-        self.exlist.add(intervals[0])
-        self.assertEqual(1, len(self.exlist))
-        self.assertTrue(
-            self.exlist.is_excluded(ExclusionPoint(charge=1, mass=1000.5, rt=1000.5,
-                                                   ook0=None, intensity=None)))
+        # the bounds of intervals[0] with charge=None, then with one more bound set to None in each step
+        bounds = dict(min_mass=1000, max_mass=1001, min_rt=1000, max_rt=1001,
+                      min_ook0=1000, max_ook0=1001, min_intensity=1000, max_intensity=1001)
+        for n_none in range(len(BOUND_FIELDS) + 1):
+            query = {**bounds, **dict.fromkeys(BOUND_FIELDS[:n_none])}
+            with self.subTest(none_fields=BOUND_FIELDS[:n_none]):
+                self.assertEqual(1, len(self.populated.query_by_interval(
+                    ExclusionInterval(interval_id='PEPTIDE', charge=None, **query))))
 
-    def test_none_interval_attributes(self):
-        self.exlist.add(intervals[0])
-        self.assertEqual(1, len(self.exlist))
-        self.assertEqual(1, len(self.exlist.query_by_interval(ExclusionInterval(interval_id='PEPTIDE',
-                                                                                charge=None,
-                                                                                min_mass=1000,
-                                                                                max_mass=1001,
-                                                                                min_rt=1000,
-                                                                                max_rt=1001,
-                                                                                min_ook0=1000,
-                                                                                max_ook0=1001,
-                                                                                min_intensity=1000,
-                                                                                max_intensity=1001))))
-
-        self.assertEqual(1, len(self.exlist.query_by_interval(ExclusionInterval(interval_id='PEPTIDE',
-                                                                                charge=None,
-                                                                                min_mass=None,
-                                                                                max_mass=1001,
-                                                                                min_rt=1000,
-                                                                                max_rt=1001,
-                                                                                min_ook0=1000,
-                                                                                max_ook0=1001,
-                                                                                min_intensity=1000,
-                                                                                max_intensity=1001))))
-
-        self.assertEqual(1, len(self.exlist.query_by_interval(ExclusionInterval(interval_id='PEPTIDE',
-                                                                                charge=None,
-                                                                                min_mass=None,
-                                                                                max_mass=None,
-                                                                                min_rt=1000,
-                                                                                max_rt=1001,
-                                                                                min_ook0=1000,
-                                                                                max_ook0=1001,
-                                                                                min_intensity=1000,
-                                                                                max_intensity=1001))))
-
-        self.assertEqual(1, len(self.exlist.query_by_interval(ExclusionInterval(interval_id='PEPTIDE',
-                                                                                charge=None,
-                                                                                min_mass=None,
-                                                                                max_mass=None,
-                                                                                min_rt=None,
-                                                                                max_rt=1001,
-                                                                                min_ook0=1000,
-                                                                                max_ook0=1001,
-                                                                                min_intensity=1000,
-                                                                                max_intensity=1001))))
-
-        self.assertEqual(1, len(self.exlist.query_by_interval(ExclusionInterval(interval_id='PEPTIDE',
-                                                                                charge=None,
-                                                                                min_mass=None,
-                                                                                max_mass=None,
-                                                                                min_rt=None,
-                                                                                max_rt=None,
-                                                                                min_ook0=1000,
-                                                                                max_ook0=1001,
-                                                                                min_intensity=1000,
-                                                                                max_intensity=1001))))
-
-        self.assertEqual(1, len(self.exlist.query_by_interval(ExclusionInterval(interval_id='PEPTIDE',
-                                                                                charge=None,
-                                                                                min_mass=None,
-                                                                                max_mass=None,
-                                                                                min_rt=None,
-                                                                                max_rt=None,
-                                                                                min_ook0=None,
-                                                                                max_ook0=1001,
-                                                                                min_intensity=1000,
-                                                                                max_intensity=1001))))
-
-        self.assertEqual(1, len(self.exlist.query_by_interval(ExclusionInterval(interval_id='PEPTIDE',
-                                                                                charge=None,
-                                                                                min_mass=None,
-                                                                                max_mass=None,
-                                                                                min_rt=None,
-                                                                                max_rt=None,
-                                                                                min_ook0=None,
-                                                                                max_ook0=None,
-                                                                                min_intensity=1000,
-                                                                                max_intensity=1001))))
-
-        self.assertEqual(1, len(self.exlist.query_by_interval(ExclusionInterval(interval_id='PEPTIDE',
-                                                                                charge=None,
-                                                                                min_mass=None,
-                                                                                max_mass=None,
-                                                                                min_rt=None,
-                                                                                max_rt=None,
-                                                                                min_ook0=None,
-                                                                                max_ook0=None,
-                                                                                min_intensity=None,
-                                                                                max_intensity=1001))))
-
-        self.assertEqual(1, len(self.exlist.query_by_interval(ExclusionInterval(interval_id='PEPTIDE',
-                                                                                charge=None,
-                                                                                min_mass=None,
-                                                                                max_mass=None,
-                                                                                min_rt=None,
-                                                                                max_rt=None,
-                                                                                min_ook0=None,
-                                                                                max_ook0=None,
-                                                                                min_intensity=None,
-                                                                                max_intensity=None))))
-
-        self.assertEqual(0, len(self.exlist.query_by_interval(ExclusionInterval(interval_id='PEPTIDE',
-                                                                                charge=None,
-                                                                                min_mass=2000,
-                                                                                max_mass=None,
-                                                                                min_rt=None,
-                                                                                max_rt=None,
-                                                                                min_ook0=None,
-                                                                                max_ook0=None,
-                                                                                min_intensity=None,
-                                                                                max_intensity=None))))
+        self.assertEqual(0, len(self.populated.query_by_interval(
+            ExclusionInterval(interval_id='PEPTIDE', charge=None,
+                              **{**dict.fromkeys(BOUND_FIELDS), 'min_mass': 2000}))))
 
     def test_save_load(self):
         self.exlist.add(intervals[0])
         self.assertEqual(1, len(self.exlist))
-        self.exlist.save("tmp.pkl")
+        buffer = io.BytesIO()
+        self.exlist.save(buffer)
+        buffer.seek(0)
         self.exlist.clear()
-        self.exlist.load("tmp.pkl")
+        self.exlist.load(buffer)
         self.assertEqual(1, len(self.exlist))
         self.assertTrue(
             self.exlist.is_excluded(ExclusionPoint(charge=1, mass=1000.5, rt=1000.5, ook0=None, intensity=1000.5)))
 
-    def test_query_by_id(self):
+    def test_save_load_remove_by_uuid(self):
         self.exlist.add(intervals[0])
-        self.assertEqual(1, len(self.exlist))
-        self.assertEqual(intervals[0], self.exlist.query_by_id('PEPTIDE')[0])
+        buffer = io.BytesIO()
+        self.exlist.save(buffer)
+        buffer.seek(0)
+        self.exlist.clear()
+        self.exlist.load(buffer)
+        self.assertEqual(1, len(self.exlist.uuid_dict))
+        self.exlist.remove_by_uuid(intervals[0].interval_uuid)
+        self.assertEqual(0, len(self.exlist))
+        self.assertEqual(0, len(self.exlist.id_dict))
+
+    def test_query_by_id(self):
+        self.assertEqual(intervals[0], self.populated.query_by_id('PEPTIDE')[0])
 
     def test_exclusion_interval_equality(self):
         self.assertEqual(intervals[0], intervals[0])
@@ -484,10 +407,8 @@ class TestExclusionList(unittest.TestCase):
         self.assertEqual(self.exlist.point_status(ExclusionPoint(mass=700, charge=None, rt=None, ook0=None, intensity=None)), IntervalStatus.EXCLUDED_INCLUDED)
 
     def test_include_false(self):
-        self.exlist.add(intervals[0])
-        self.assertEqual(1, len(self.exlist))
-        self.assertFalse(self.exlist.is_included(ExclusionPoint(charge=1, mass=1000.5, rt=1000.5,
-                                                                ook0=1000.5, intensity=1000.5)))
+        self.assertFalse(self.populated.is_included(ExclusionPoint(charge=1, mass=1000.5, rt=1000.5,
+                                                                   ook0=1000.5, intensity=1000.5)))
 
     def test_include_true(self):
         interval = ExclusionInterval(interval_id='PEPTIDE',
@@ -542,6 +463,173 @@ class TestExclusionList(unittest.TestCase):
         self.exlist.remove(interval1)
         self.assertEqual(len(self.exlist), 0)
 
+    def test_query_by_point_without_mass(self):
+        point = ExclusionPoint(charge=1, mass=None, rt=1001.5, ook0=None, intensity=None)
+        self.exlist.add(intervals[0])
+        self.assertEqual([], list(self.exlist.query_by_point(point)))
+
+        # the snapshot used to scan without a mass must follow adds and removes
+        self.exlist.add(intervals[1])
+        self.assertEqual([intervals[1]], list(self.exlist.query_by_point(point)))
+        self.exlist.remove_by_uuid(intervals[1].interval_uuid)
+        self.assertEqual([], list(self.exlist.query_by_point(point)))
+
+    def test_change_stored_interval(self):
+        interval = ExclusionInterval(interval_id='PEPTIDE', charge=1, min_mass=1000, max_mass=1001,
+                                     **dict.fromkeys(BOUND_FIELDS[2:]))
+        old_point = ExclusionPoint(**CENTER_POINT)
+        new_point = ExclusionPoint(**{**CENTER_POINT, 'mass': 2000.5, 'rt': 2000.5})
+        no_mass = ExclusionPoint(**{**CENTER_POINT, 'mass': None})
+        no_mass_query = ExclusionInterval(interval_id=None, charge=None, min_mass=None, max_mass=None, min_rt=1999,
+                                          max_rt=2002, min_ook0=None, max_ook0=None, min_intensity=None,
+                                          max_intensity=None)
+        self.exlist.add(interval)
+        self.assertEqual([True, False], self.exlist.are_excluded([old_point, new_point]).tolist())
+        self.assertEqual([interval], list(self.exlist.query_by_point(no_mass)))
+        self.assertEqual([], self.exlist.query_by_interval(no_mass_query))
+
+        # stored intervals are changed by removing and re-adding them, after which every query path agrees
+        self.exlist.remove_by_uuid(interval.interval_uuid)
+        interval.min_mass, interval.max_mass = 2000, 2001
+        interval.min_rt, interval.max_rt = 2000, 2001
+        self.exlist.add(interval)
+        for point in (old_point, new_point):
+            self.assertEqual([self.exlist.is_excluded(point)], self.exlist.are_excluded([point]).tolist())
+        self.assertEqual([False, True], self.exlist.are_excluded([old_point, new_point]).tolist())
+        self.assertEqual([], list(self.exlist.query_by_point(no_mass)))
+        self.assertEqual([interval], self.exlist.query_by_interval(no_mass_query))
+
+        self.exlist.remove_by_uuid(interval.interval_uuid)
+        interval.exclusion = False
+        self.exlist.add(interval)
+        self.assertFalse(self.exlist.is_excluded(new_point))
+        self.assertEqual([False], self.exlist.are_excluded([new_point]).tolist())
+
+    def test_large_charge(self):
+        interval = ExclusionInterval(interval_id='PEPTIDE', charge=300, min_mass=1000, max_mass=1001,
+                                     **dict.fromkeys(BOUND_FIELDS[2:]))
+        self.exlist.add(interval)
+        point = ExclusionPoint(**{**CENTER_POINT, 'charge': 300})
+        self.assertEqual([True], self.exlist.are_excluded([point]).tolist())
+        self.assertEqual([False], self.exlist.are_excluded([ExclusionPoint(**CENTER_POINT)]).tolist())
+        self.assertEqual([interval], list(self.exlist.query_by_point(ExclusionPoint(**{**CENTER_POINT, 'charge': 300,
+                                                                                          'mass': None}))))
+        self.assertEqual([interval], self.exlist.query_by_interval(
+            ExclusionInterval(interval_id=None, charge=300, **dict.fromkeys(BOUND_FIELDS))))
+
+    def test_is_excluded_cached(self):
+        point = ExclusionPoint(**CENTER_POINT)
+        self.assertFalse(self.exlist.is_excluded_cached(point))
+
+        # the cached result must follow adds and removes
+        self.exlist.add(intervals[0])
+        self.assertTrue(self.exlist.is_excluded_cached(point))
+        self.assertTrue(self.exlist.is_excluded_cached(ExclusionPoint(**CENTER_POINT)))
+        self.exlist.remove_by_uuid(intervals[0].interval_uuid)
+        self.assertFalse(self.exlist.is_excluded_cached(point))
+
+        # and stored intervals changed by removing and re-adding them
+        interval = ExclusionInterval(interval_id='PEPTIDE', charge=1, min_mass=1000, max_mass=1001,
+                                     **dict.fromkeys(BOUND_FIELDS[2:]))
+        self.exlist.add(interval)
+        self.assertTrue(self.exlist.is_excluded_cached(point))
+        self.exlist.remove_by_uuid(interval.interval_uuid)
+        interval.min_mass, interval.max_mass = 2000, 2001
+        self.exlist.add(interval)
+        self.assertFalse(self.exlist.is_excluded_cached(point))
+        self.assertTrue(self.exlist.is_excluded_cached(ExclusionPoint(**{**CENTER_POINT, 'mass': 2000.5})))
+        self.exlist.clear()
+        self.assertFalse(self.exlist.is_excluded_cached(ExclusionPoint(**{**CENTER_POINT, 'mass': 2000.5})))
+
+        with mock.patch('exclusionms.db.EXCLUDED_CACHE_SIZE', 2):
+            points = [ExclusionPoint(**{**CENTER_POINT, 'mass': mass}) for mass in (1, 2, 3)]
+            self.assertEqual([False] * 3, [self.exlist.is_excluded_cached(point) for point in points])
+            self.assertLessEqual(len(self.exlist._excluded_cache), 2)
+
+    def test_query_by_point_mass_only(self):
+        self.exlist.add(intervals[0])
+        self.exlist.add(ExclusionInterval(interval_id='ANY_CHARGE', charge=None, min_mass=1000, max_mass=1001,
+                                          min_rt=None, max_rt=None, min_ook0=None, max_ook0=None,
+                                          min_intensity=None, max_intensity=None))
+        self.assertEqual(2, len(list(self.exlist.query_by_point(
+            ExclusionPoint(charge=None, mass=1000.5, rt=None, ook0=None, intensity=None)))))
+        self.assertEqual(2, len(list(self.exlist.query_by_point(
+            ExclusionPoint(charge=1, mass=1000.5, rt=None, ook0=None, intensity=None)))))
+        self.assertEqual(['ANY_CHARGE'], [interval.interval_id for interval in self.exlist.query_by_point(
+            ExclusionPoint(charge=2, mass=1000.5, rt=None, ook0=None, intensity=None))])
+
+    def test_add_remove_unbounded_mass(self):
+        self.exlist.add(intervals[0])
+        self.exlist.add(intervals[1])
+        tmp_msg = ExclusionInterval(interval_id=None,
+                                    charge=None,
+                                    min_mass=None,
+                                    max_mass=None,
+                                    min_rt=1000,
+                                    max_rt=1001,
+                                    min_ook0=None,
+                                    max_ook0=None,
+                                    min_intensity=None,
+                                    max_intensity=None)
+        self.assertEqual([intervals[0]], self.exlist.query_by_interval(tmp_msg))
+        self.assertEqual([intervals[0]], self.exlist.remove(tmp_msg))
+        self.assertEqual([intervals[1]], list(self.exlist))
+
+    def test_save_load_npz(self):
+        none_interval = ExclusionInterval(interval_id='NONE', charge=None,
+                                          min_mass=None, max_mass=None,
+                                          min_rt=None, max_rt=1001,
+                                          min_ook0=None, max_ook0=None,
+                                          min_intensity=None, max_intensity=None,
+                                          exclusion=False, data={'scans': [1, 2]})
+        self.exlist.add(intervals[0])
+        self.exlist.add(none_interval)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_path = os.path.join(tmp_dir, 'tmp.npz')
+            self.exlist.save(file_path)
+            # no array needs unpickling
+            with np.load(file_path, allow_pickle=False) as arrays:
+                self.assertIn('data', arrays.files)
+                for name in arrays.files:
+                    self.assertNotEqual(object, arrays[name].dtype)
+            self.exlist.clear()
+            self.exlist.load(file_path)
+
+        self.assertEqual(2, len(self.exlist))
+        self.assertEqual(2, len(self.exlist.uuid_dict))
+        self.assertIsNone(self.exlist.query_by_id('PEPTIDE')[0].data)
+        loaded = self.exlist.query_by_id('NONE')[0]
+        self.assertEqual(none_interval, loaded)
+        self.assertEqual(none_interval.data, loaded.data)
+        self.assertEqual(none_interval.interval_uuid, loaded.interval_uuid)
+        self.assertIsNone(loaded.min_mass)
+        self.assertIsNone(loaded.charge)
+        self.assertFalse(loaded.exclusion)
+        self.assertTrue(
+            self.exlist.is_excluded(ExclusionPoint(charge=1, mass=1000.5, rt=1000.5, ook0=None, intensity=1000.5)))
+
+    def test_are_excluded(self):
+        rng = random.Random(0)
+        for _ in range(200):
+            bounds = sorted([rng.uniform(0, 10), rng.uniform(0, 10)]) * 4
+            values = {field: rng.choice([None, bound]) for field, bound in zip(BOUND_FIELDS, bounds)}
+            if values['min_mass'] is not None and values['min_mass'] == values['max_mass']:
+                values['max_mass'] = None
+            self.exlist.add(ExclusionInterval(interval_id='PEPTIDE', charge=rng.choice([None, 1, 2]),
+                                              exclusion=rng.random() < 0.8, **values))
+        points = [ExclusionPoint(**dict(zip(POINT_FIELDS, [rng.choice([None, 1, 2])] +
+                                            [rng.choice([None, rng.uniform(0, 10)]) for _ in range(4)])))
+                  for _ in range(100)]
+
+        expected = [self.exlist.is_excluded(point) for point in points]
+        self.assertEqual(expected, self.exlist.are_excluded(points).tolist())
+        # candidate pairs are checked in chunks, which must not change the result
+        with mock.patch('exclusionms.db.MAX_CANDIDATE_PAIRS', 7):
+            self.assertEqual(expected, self.exlist.are_excluded(points).tolist())
+        self.assertEqual([], self.exlist.are_excluded([]).tolist())
+        self.assertEqual([False], ExclusionList().are_excluded(points[:1]).tolist())
+
 
 if __name__ == '__main__':
     unittest.main()
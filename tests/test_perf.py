@@ -0,0 +1,62 @@
+"""
+Benchmarks of the MassIntervalTree query paths, run with pytest-benchmark (installed by the test extra,
+pip install .[test]):
+
+    pytest tests/test_perf.py --benchmark-only
+
+Compare runs with --benchmark-autosave and --benchmark-compare to catch regressions. Pass --benchmark-skip to run
+the rest of the suite without them, as CI does.
+"""
+
+import random
+
+import pytest
+
+from exclusionms.components import DynamicExclusionTolerance, ExclusionInterval
+from exclusionms.db import MassIntervalTree
+from exclusionms.random import generate_random_interval, generate_random_point
+
+pytest.importorskip('pytest_benchmark')
+
+RANGES = dict(charge_range=(1, 4), mass_range=(500, 5000), rt_range=(0, 10000), ook0_range=(0.5, 1.5),
+              intensity_range=(0, 1e6))
+TOLERANCE = DynamicExclusionTolerance(charge=True, mass=50, rt=60, ook0=0.05, intensity=0.5)
+
+
+@pytest.fixture(scope='module')
+def tree() -> MassIntervalTree:
+    random.seed(0)
+    interval_tree = MassIntervalTree()
+    for i in range(10_000):
+        interval_tree.add(generate_random_interval(TOLERANCE, interval_id=str(i % 100), **RANGES))
+    return interval_tree
+
+
+@pytest.fixture(scope='module')
+def points() -> list:
+    random.seed(1)
+    return [generate_random_point(**RANGES) for _ in range(1024)]
+
+
+def test_is_excluded(benchmark, tree, points):
+    benchmark(lambda: [tree.is_excluded(point) for point in points])
+
+
+def test_are_excluded(benchmark, tree, points):
+    tree.get_snapshot()
+    benchmark(tree.are_excluded, points)
+
+
+def test_point_status(benchmark, tree, points):
+    benchmark(lambda: [tree.point_status(point) for point in points])
+
+
+def test_query_by_interval_without_mass(benchmark, tree):
+    query = ExclusionInterval(interval_id=None, charge=None, min_mass=None, max_mass=None, min_rt=0, max_rt=5000,
+                              min_ook0=None, max_ook0=None, min_intensity=None, max_intensity=None)
+    tree.get_snapshot()
+    benchmark(tree.query_by_interval, query)
+
+
+def test_query_by_id(benchmark, tree):
+    benchmark(tree.query_by_id, '0')